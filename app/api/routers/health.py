@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from app.db.session import engine
+
 router = APIRouter(tags=["Health"])
 
 
@@ -9,3 +11,9 @@ router = APIRouter(tags=["Health"])
 def health_check() -> dict:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@router.get("/health/pool")
+def pool_status() -> dict:
+    """Report the database connection pool status."""
+    return {"pool": engine.pool.status()}
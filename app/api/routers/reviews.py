@@ -1,15 +1,24 @@
 """Reviews CRUD endpoints."""
 
+import contextlib
+import functools
 import logging
 import os
+import re
 import shutil
 import uuid
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Annotated
 
-from fastapi import APIRouter, Form, HTTPException, UploadFile, status
-from sqlalchemy import select
+import aiofiles
+import aiofiles.os
+from fastapi import APIRouter, Body, Form, HTTPException, UploadFile, status
+from fastapi_cache.decorator import cache
+from sqlalchemy import Integer, bindparam, delete, insert, select, update
 
-from app.db.session import DbSession
+from app.cache import REVIEW_ITEM_NAMESPACE, REVIEWS_LIST_NAMESPACE, invalidate_reviews_cache
+from app.db.session import DbSession, after_commit, after_rollback
 from app.models.review import MediaType, Review
 from app.schemas.review import ReviewCreate, ReviewCreateForm, ReviewRead, ReviewUpdate
 
@@ -20,6 +29,12 @@ router = APIRouter(prefix="/reviews", tags=["Reviews"])
 # Max file size for image uploads (5MB)
 MAX_IMAGE_SIZE = 5 * 1024 * 1024
 
+# Max number of reviews accepted by one bulk create request
+MAX_BULK_REVIEWS = 100
+
+# Chunk size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 # Directory for uploaded files
 UPLOADS_DIR = os.getenv("UPLOADS_DIR", "uploads")
 
@@ -32,9 +47,28 @@ IMAGE_SIGNATURES = {
     b"RIFF": "image/webp",  # WebP (starts with RIFF)
 }
 
+# All signatures folded into one anchored pattern, matched in a single call
+_IMAGE_SIGNATURE_RE = re.compile(b"|".join(re.escape(sig) for sig in IMAGE_SIGNATURES))
+
+# Only this many leading bytes are inspected (covers the longest signature)
+_SIGNATURE_PREFIX_LEN = 16
+
+# Base list query and filter fragments, built once and bound per request
+_LIST_REVIEWS = select(Review).order_by(Review.id.desc())
+_BY_AFTER_ID = Review.id < bindparam("after_id")
+_BY_MEDIA_TYPE = Review.media_type == bindparam("media_type")
+_BY_MEDIA_TITLE = Review.media_title.ilike(bindparam("media_title"), escape="\\")
+_BY_AUTHOR_NAME = Review.author_name == bindparam("author_name")
+_BY_MIN_RATING = Review.rating >= bindparam("min_rating")
+_LIMIT = bindparam("limit", type_=Integer)
+_OFFSET = bindparam("offset", type_=Integer)
+
+# Escapes LIKE wildcards so user input is matched literally
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
 
 @router.post("/", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
-def create_review(data: ReviewCreate, db: DbSession) -> Review:
+async def create_review(data: ReviewCreate, db: DbSession) -> Review:
     """Create a new review."""
     review = Review(
         author_name=data.author_name,
@@ -47,11 +81,30 @@ def create_review(data: ReviewCreate, db: DbSession) -> Review:
         contains_spoilers=data.contains_spoilers,
     )
     db.add(review)
-    db.commit()
-    db.refresh(review)
+    await db.flush()
+    after_commit(db, invalidate_reviews_cache)
     return review
 
 
+@router.post(
+    "/bulk", response_model=list[ReviewRead], status_code=status.HTTP_201_CREATED
+)
+async def create_reviews_bulk(
+    data: Annotated[list[ReviewCreate], Body(max_length=MAX_BULK_REVIEWS)], db: DbSession
+) -> Sequence[Review]:
+    """Create many reviews in a single INSERT and transaction."""
+    if not data:
+        return []
+
+    result = await db.scalars(
+        insert(Review).returning(Review),
+        [item.model_dump() for item in data],
+    )
+    reviews = result.all()
+    after_commit(db, invalidate_reviews_cache)
+    return reviews
+
+
 @router.post("/with-image", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
 async def create_review_with_image(
     db: DbSession,
@@ -65,6 +118,24 @@ async def create_review_with_image(
     file: UploadFile | None = None,
 ) -> Review:
     """Create a new review with optional image upload."""
+    staged_path: str | None = None
+
+    # Validate and store the image before touching the database
+    if file is not None and file.filename:
+        _ensure_image_content_type(file)
+
+        # Generate safe filename with validated extension
+        extension = _get_safe_extension(file.filename)
+        safe_filename = f"{uuid.uuid4().hex}{extension}"
+
+        # Stage the upload until the review ID is known
+        staging_dir = f"{UPLOADS_DIR}/reviews"
+        await aiofiles.os.makedirs(staging_dir, exist_ok=True)
+        staged_path = f"{staging_dir}/.{safe_filename}.part"
+        await _save_image_upload(file, staged_path)
+        # Drop the image again if the review is never committed
+        after_rollback(db, functools.partial(_discard_file, staged_path))
+
     # Create the review
     review = Review(
         author_name=author_name,
@@ -76,149 +147,207 @@ async def create_review_with_image(
         contains_spoilers=contains_spoilers,
     )
     db.add(review)
-    db.commit()
-    db.refresh(review)
     
-    # If image file provided, validate and save it
-    if file is not None and file.filename:
-        # Validate content type
-        if not file.content_type or not file.content_type.startswith("image/"):
-            # Rollback review creation
-            db.delete(review)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File must be an image",
-            )
-        
-        # Read file content and validate size
-        content = await file.read()
-        if len(content) > MAX_IMAGE_SIZE:
-            db.delete(review)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of {MAX_IMAGE_SIZE // (1024 * 1024)}MB",
-            )
-        
-        # Validate image signature (magic bytes)
-        if not _validate_image_signature(content):
-            db.delete(review)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid image file format",
-            )
-        
-        # Generate safe filename with validated extension
-        extension = _get_safe_extension(file.filename)
-        safe_filename = f"{uuid.uuid4().hex}{extension}"
-        
-        # Create directory and save file
-        review_uploads_dir = Path(UPLOADS_DIR) / "reviews" / str(review.id)
-        review_uploads_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_path = review_uploads_dir / safe_filename
-        file_path.write_bytes(content)
+    if staged_path is not None:
+        # Flush to obtain the review ID for the upload path
+        await db.flush()
+
+        # Move the staged file into the review's directory
+        file_path = f"{_ensure_review_dir(UPLOADS_DIR, review.id)}/{safe_filename}"
+        await _move_staged_upload(staged_path, file_path)
+        after_rollback(db, functools.partial(_discard_file, file_path))
         
         # Update review with image path
-        relative_path = f"{UPLOADS_DIR}/reviews/{review.id}/{safe_filename}"
-        review.image_path = relative_path
-        db.commit()
-        db.refresh(review)
+        review.image_path = file_path
+
+    await db.flush()
+    after_commit(db, invalidate_reviews_cache)
     
     return review
 
 
 @router.get("/", response_model=list[ReviewRead])
-def list_reviews(
+@cache(expire=30, namespace=REVIEWS_LIST_NAMESPACE)
+async def list_reviews(
     db: DbSession,
     limit: int = 100,
     offset: int = 0,
+    after_id: int | None = None,
     media_type: MediaType | None = None,
     media_title: str | None = None,
     author_name: str | None = None,
     min_rating: int | None = None,
-) -> list[Review]:
-    """List reviews with optional filtering and pagination."""
-    query = select(Review)
+) -> list[ReviewRead]:
+    """List reviews with optional filtering and pagination.
+
+    Reviews are returned newest first. Pass the last ID of the previous
+    page as ``after_id`` for keyset pagination; ``offset`` is kept for
+    clients that page by position.
+    """
+    query = _LIST_REVIEWS
+    params: dict = {"limit": limit}
+
+    if after_id is not None:
+        query = query.where(_BY_AFTER_ID)
+        params["after_id"] = after_id
 
     if media_type is not None:
-        query = query.where(Review.media_type == media_type)
+        query = query.where(_BY_MEDIA_TYPE)
+        params["media_type"] = media_type
 
     if media_title is not None:
-        query = query.where(Review.media_title.ilike(f"%{media_title}%"))
+        query = query.where(_BY_MEDIA_TITLE)
+        params["media_title"] = f"%{media_title.translate(_LIKE_ESCAPES)}%"
 
     if author_name is not None:
-        query = query.where(Review.author_name == author_name)
+        query = query.where(_BY_AUTHOR_NAME)
+        params["author_name"] = author_name
 
     if min_rating is not None:
-        query = query.where(Review.rating >= min_rating)
+        query = query.where(_BY_MIN_RATING)
+        params["min_rating"] = min_rating
+
+    if offset:
+        query = query.offset(_OFFSET)
+        params["offset"] = offset
 
-    query = query.offset(offset).limit(limit)
-    result = db.execute(query)
-    return list(result.scalars().all())
+    query = query.limit(_LIMIT)
+    result = await db.execute(query, params)
+    return [ReviewRead.model_validate(review) for review in result.scalars()]
 
 
 @router.get("/{review_id}", response_model=ReviewRead)
-def get_review(review_id: int, db: DbSession) -> Review:
+@cache(expire=60, namespace=REVIEW_ITEM_NAMESPACE)
+async def get_review(review_id: int, db: DbSession) -> ReviewRead:
     """Get a review by ID."""
-    review = db.get(Review, review_id)
+    review = await db.get(Review, review_id)
     if review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
         )
-    return review
+    return ReviewRead.model_validate(review)
 
 
 @router.patch("/{review_id}", response_model=ReviewRead)
-def update_review(review_id: int, data: ReviewUpdate, db: DbSession) -> Review:
+async def update_review(review_id: int, data: ReviewUpdate, db: DbSession) -> Review:
     """Update a review (partial update)."""
-    review = db.get(Review, review_id)
+    update_data = data.model_dump(exclude_unset=True)
+    if update_data:
+        # Update and load the row in a single UPDATE ... RETURNING
+        result = await db.execute(
+            update(Review)
+            .where(Review.id == review_id)
+            .values(**update_data)
+            .returning(Review)
+        )
+        review = result.scalar_one_or_none()
+    else:
+        review = await db.get(Review, review_id)
+
     if review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
         )
 
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(review, field, value)
-
-    db.commit()
-    db.refresh(review)
+    after_commit(db, invalidate_reviews_cache)
     return review
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_review(review_id: int, db: DbSession) -> None:
+async def delete_review(review_id: int, db: DbSession) -> None:
     """Delete a review and its associated image files."""
-    review = db.get(Review, review_id)
-    if review is None:
+    # Delete and check existence in a single DELETE ... RETURNING
+    result = await db.execute(
+        delete(Review).where(Review.id == review_id).returning(Review.image_path)
+    )
+    row = result.first()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
         )
 
-    # Delete associated image files if present (best-effort)
-    if review.image_path:
-        review_uploads_dir = Path(UPLOADS_DIR) / "reviews" / str(review_id)
-        try:
-            if review_uploads_dir.exists():
-                shutil.rmtree(review_uploads_dir)
-        except OSError as e:
-            logger.warning(
-                "Failed to delete image directory for review %d: %s", review_id, e
-            )
+    after_commit(db, invalidate_reviews_cache)
+
+    # Delete associated image files once the delete is committed
+    if row.image_path:
+        after_commit(db, functools.partial(_remove_review_uploads, UPLOADS_DIR, review_id))
+
+
+async def _remove_review_uploads(uploads_dir: str, review_id: int) -> None:
+    """Delete a review's upload directory (best-effort)."""
+    review_uploads_dir = Path(uploads_dir) / "reviews" / str(review_id)
+    try:
+        if review_uploads_dir.exists():
+            shutil.rmtree(review_uploads_dir)
+    except OSError as e:
+        logger.warning(
+            "Failed to delete image directory for review %d: %s", review_id, e
+        )
+
 
-    db.delete(review)
-    db.commit()
+async def _discard_file(path: str) -> None:
+    """Delete a file written for a request whose transaction rolled back."""
+    with contextlib.suppress(OSError):
+        await aiofiles.os.remove(path)
 
 
 def _validate_image_signature(content: bytes) -> bool:
     """Validate file content against known image signatures."""
-    for signature in IMAGE_SIGNATURES:
-        if content.startswith(signature):
-            return True
-    return False
+    return _IMAGE_SIGNATURE_RE.match(content[:_SIGNATURE_PREFIX_LEN]) is not None
+
+
+def _ensure_image_content_type(file: UploadFile) -> None:
+    """Reject uploads that are not declared as images."""
+    if not file.content_type or not file.content_type.startswith("image/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an image",
+        )
+
+
+def _ensure_review_dir(uploads_dir: str, review_id: int) -> str:
+    """Create a review's upload directory if needed and return its path.
+
+    This is a single cheap syscall when the directory exists. It is not
+    memoized, since another worker or an admin may remove the directory.
+    """
+    path = f"{uploads_dir}/reviews/{review_id}"
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+async def _save_image_upload(file: UploadFile, file_path: str) -> None:
+    """Stream an uploaded image to disk, validating it chunk by chunk.
+
+    Only one chunk is held in memory at a time. The partially written file
+    is removed if validation fails.
+    """
+    total = 0
+    try:
+        async with aiofiles.open(file_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                # Validate image signature (magic bytes) on the first chunk
+                if total == 0 and not _validate_image_signature(chunk):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid image file format",
+                    )
+                total += len(chunk)
+                if total > MAX_IMAGE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"File size exceeds maximum allowed size of {MAX_IMAGE_SIZE // (1024 * 1024)}MB",
+                    )
+                await out.write(chunk)
+        if total == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid image file format",
+            )
+    except Exception:
+        with contextlib.suppress(OSError):
+            await aiofiles.os.remove(file_path)
+        raise
 
 
 def _get_safe_extension(filename: str | None) -> str:
@@ -232,53 +361,51 @@ def _get_safe_extension(filename: str | None) -> str:
 
 
 @router.post("/{review_id}/image", response_model=ReviewRead)
-async def upload_review_image(
-    review_id: int, file: UploadFile, db: DbSession
-) -> Review:
-    """Upload an image for a review."""
-    review = db.get(Review, review_id)
+async def upload_review_image(review_id: int, file: UploadFile, db: DbSession) -> Review:
+    """Upload an image for a review.
+
+    The upload is streamed to a staging file and only moved into place once
+    it has been validated, so the final path never holds a partial image.
+    """
+    review = await db.get(Review, review_id)
     if review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
         )
 
-    # Validate content type
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File must be an image",
-        )
-
-    # Read file content and validate size
-    content = await file.read()
-    if len(content) > MAX_IMAGE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds maximum allowed size of {MAX_IMAGE_SIZE // (1024 * 1024)}MB",
-        )
-
-    # Validate image signature (magic bytes)
-    if not _validate_image_signature(content):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid image file format",
-        )
+    _ensure_image_content_type(file)
 
     # Generate safe filename with validated extension
     extension = _get_safe_extension(file.filename)
     safe_filename = f"{uuid.uuid4().hex}{extension}"
 
-    # Create directory and save file
-    review_uploads_dir = Path(UPLOADS_DIR) / "reviews" / str(review_id)
-    review_uploads_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = review_uploads_dir / safe_filename
-    file_path.write_bytes(content)
+    # Stream the file to a staging path next to its final location
+    base = _ensure_review_dir(UPLOADS_DIR, review_id)
+    file_path = f"{base}/{safe_filename}"
+    staged_path = f"{base}/.{safe_filename}.part"
+    await _save_image_upload(file, staged_path)
+    await _move_staged_upload(staged_path, file_path)
+    after_rollback(db, functools.partial(_discard_file, file_path))
+
+    # Update review with image path (relative to the working directory)
+    review.image_path = file_path
+    await db.flush()
+    after_commit(db, invalidate_reviews_cache)
+    return review
 
-    # Update review with image path
-    relative_path = f"{UPLOADS_DIR}/reviews/{review_id}/{safe_filename}"
-    review.image_path = relative_path
-    db.commit()
-    db.refresh(review)
 
-    return review
+async def _move_staged_upload(staged_path: str, file_path: str) -> None:
+    """Move a validated upload into place (atomic on the same filesystem).
+
+    The staged file is removed if the move fails.
+    """
+    try:
+        await aiofiles.os.replace(staged_path, file_path)
+    except OSError as e:
+        with contextlib.suppress(OSError):
+            await aiofiles.os.remove(staged_path)
+        logger.error("Failed to move image upload into place at %s: %s", file_path, e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store image",
+        ) from e
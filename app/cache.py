@@ -0,0 +1,60 @@
+"""Response caching for read-heavy endpoints."""
+
+import hashlib
+import os
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Cache namespaces, cleared on every write to reviews
+REVIEWS_LIST_NAMESPACE = "reviews_list"
+REVIEW_ITEM_NAMESPACE = "review_item"
+
+# Redis URL for a shared cache; falls back to per-process memory when unset
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+) -> str:
+    """Build a cache key from the request path and sorted query parameters.
+
+    The default key builder hashes the endpoint kwargs, which include the
+    per-request DB session and therefore never repeat.
+    """
+    if request is None:
+        raw = f"{func.__module__}:{func.__name__}"
+    else:
+        query = urlencode(sorted(request.query_params.multi_items()))
+        raw = f"{request.url.path}?{query}"
+    return f"{namespace}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def init_cache() -> None:
+    """Initialize the response cache backend."""
+    if REDIS_URL:
+        from fastapi_cache.backends.redis import RedisBackend
+        from redis.asyncio import Redis
+
+        backend = RedisBackend(Redis.from_url(REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+
+    FastAPICache.init(backend, prefix="echo", key_builder=request_key_builder)
+
+
+async def invalidate_reviews_cache() -> None:
+    """Drop cached review lists and single reviews after a write."""
+    await FastAPICache.clear(namespace=REVIEWS_LIST_NAMESPACE)
+    await FastAPICache.clear(namespace=REVIEW_ITEM_NAMESPACE)
@@ -1,6 +1,13 @@
 """Database module with engine, session, and base."""
 
-from app.db.migrations import run_migrations
+from app.db.migrations import SCHEMA_REVISION, check_schema_revision, upgrade_legacy_schema
 from app.db.session import Base, engine, get_db
 
-__all__ = ["Base", "engine", "get_db", "run_migrations"]
+__all__ = [
+    "SCHEMA_REVISION",
+    "Base",
+    "check_schema_revision",
+    "engine",
+    "get_db",
+    "upgrade_legacy_schema",
+]
@@ -1,25 +1,63 @@
-"""Database migrations for schema updates that create_all() cannot handle."""
+"""Schema revision checks and upgrades for databases predating Alembic.
+
+Schema changes are managed by Alembic revisions in ``migrations/``. The
+helpers here let the API verify the schema revision at startup and let the
+baseline revision bring databases created by create_all() up to date.
+"""
 
 from sqlalchemy import inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from app.db.session import Base
+
+# Alembic revision the models in this codebase expect (``alembic heads``)
+SCHEMA_REVISION = "0001"
+
+
+def check_schema_revision(connection: Connection) -> None:
+    """Ensure the database has been migrated to SCHEMA_REVISION.
+
+    Costs a single query, so worker startup does not depend on table count.
+
+    Raises:
+        RuntimeError: If the database is not at the expected revision.
+    """
+    try:
+        version = connection.execute(
+            text("SELECT version_num FROM alembic_version")
+        ).scalar()
+    except DBAPIError:
+        version = None
+
+    if version != SCHEMA_REVISION:
+        raise RuntimeError(
+            f"Database schema is at revision {version!r}, expected "
+            f"{SCHEMA_REVISION!r}; run `alembic upgrade head`"
+        )
 
 
-def run_migrations(engine: Engine) -> None:
-    """Run database migrations.
+def upgrade_legacy_schema(connection: Connection) -> None:
+    """Upgrade a reviews table created by create_all() before Alembic.
 
-    This handles schema changes that SQLAlchemy's create_all() cannot manage,
-    such as altering column types on existing tables.
+    This handles schema changes that create_all() cannot manage, such as
+    altering column types on existing tables. Runs on a synchronous
+    connection, e.g. ``op.get_bind()`` inside a revision.
     """
-    _migrate_author_telegram_id_to_bigint(engine)
+    _migrate_author_telegram_id_to_bigint(connection)
+    _migrate_timestamps_to_server_defaults(connection)
+    _enable_pg_trgm(connection)
+    _drop_media_title_btree_index(connection)
+    _create_missing_indexes(connection)
 
 
-def _migrate_author_telegram_id_to_bigint(engine: Engine) -> None:
+def _migrate_author_telegram_id_to_bigint(connection: Connection) -> None:
     """Migrate author_telegram_id column from INTEGER to BIGINT if needed.
 
     Telegram user IDs can exceed the INTEGER range (max 2,147,483,647),
     so we need BIGINT to store them properly.
     """
-    inspector = inspect(engine)
+    inspector = inspect(connection)
 
     # Check if the reviews table exists
     if not inspector.has_table("reviews"):
@@ -33,12 +71,68 @@ def _migrate_author_telegram_id_to_bigint(engine: Engine) -> None:
             col_type = str(col["type"]).upper()
             # PostgreSQL uses INTEGER, SQLite uses INTEGER
             # We need to alter to BIGINT only for PostgreSQL
-            if "BIGINT" not in col_type and engine.dialect.name == "postgresql":
-                with engine.begin() as conn:
-                    conn.execute(
-                        text(
-                            "ALTER TABLE reviews "
-                            "ALTER COLUMN author_telegram_id TYPE BIGINT"
-                        )
+            if "BIGINT" not in col_type and connection.dialect.name == "postgresql":
+                connection.execute(
+                    text(
+                        "ALTER TABLE reviews "
+                        "ALTER COLUMN author_telegram_id TYPE BIGINT"
                     )
+                )
             break
+
+
+def _migrate_timestamps_to_server_defaults(connection: Connection) -> None:
+    """Migrate created_at/updated_at to TIMESTAMPTZ with a now() default.
+
+    Timestamps used to be generated in Python as UTC and stored without a
+    time zone; the database now fills them in itself.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    inspector = inspect(connection)
+    if not inspector.has_table("reviews"):
+        return  # Table doesn't exist yet, create_all will create it correctly
+
+    for col in inspector.get_columns("reviews"):
+        if col["name"] not in ("created_at", "updated_at"):
+            continue
+        if not getattr(col["type"], "timezone", False):
+            connection.execute(
+                text(
+                    f"ALTER TABLE reviews ALTER COLUMN {col['name']} "
+                    f"TYPE TIMESTAMP WITH TIME ZONE USING {col['name']} AT TIME ZONE 'UTC'"
+                )
+            )
+        if not col.get("default"):
+            connection.execute(
+                text(f"ALTER TABLE reviews ALTER COLUMN {col['name']} SET DEFAULT now()")
+            )
+
+
+def _enable_pg_trgm(connection: Connection) -> None:
+    """Enable the pg_trgm extension used by the media title trigram index."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def _drop_media_title_btree_index(connection: Connection) -> None:
+    """Drop the B-tree media_title index superseded by the trigram index.
+
+    Title search uses a leading-wildcard ILIKE, which a B-tree cannot serve.
+    """
+    connection.execute(text("DROP INDEX IF EXISTS ix_reviews_media_title"))
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Create indexes added to the reviews table after it was first created.
+
+    create_all() skips existing tables entirely, so new indexes on them
+    have to be created here.
+    """
+    table = Base.metadata.tables.get("reviews")
+    if table is None or not inspect(connection).has_table("reviews"):
+        return  # create_all will create the table with all its indexes
+
+    for index in table.indexes:
+        index.create(connection, checkfirst=True)
@@ -1,21 +1,43 @@
 """Database session management."""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import StaticPool
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _engine_options(url: str) -> dict:
+    """Build engine keyword arguments appropriate for the database dialect."""
+    if url.startswith("sqlite"):
+        options: dict = {"connect_args": {"check_same_thread": False}}
+        if ":memory:" in url:
+            # In-memory databases live on a single connection
+            options["poolclass"] = StaticPool
+        return options
+
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_timeout": 10,
+    }
+
+
+engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 class Base(DeclarativeBase):
@@ -24,16 +46,50 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Dependency that provides a database session.
+def after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Schedule a callback to run once the request's transaction has committed.
+
+    Callbacks are dropped if the transaction rolls back.
+    """
+    db.info.setdefault("after_commit", []).append(callback)
+
+
+async def run_after_commit_callbacks(db: AsyncSession) -> None:
+    """Run and clear the callbacks scheduled with after_commit()."""
+    for callback in db.info.pop("after_commit", ()):
+        await callback()
+
+
+def after_rollback(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Schedule a callback to run if the request's transaction rolls back.
+
+    Use it to undo side effects outside the database, such as files written
+    for rows that are never committed.
+    """
+    db.info.setdefault("after_rollback", []).append(callback)
+
+
+async def run_after_rollback_callbacks(db: AsyncSession) -> None:
+    """Run and clear the callbacks scheduled with after_rollback()."""
+    for callback in db.info.pop("after_rollback", ()):
+        await callback()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides a database session wrapped in a transaction.
 
-    Yields a database session and ensures it is closed after use.
+    The transaction commits when the endpoint returns and rolls back if it
+    raises (or the commit fails); the session is always closed after use.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            async with db.begin():
+                yield db
+        except BaseException:
+            await run_after_rollback_callbacks(db)
+            raise
+        await run_after_commit_callbacks(db)
 
 
-DbSession = Annotated[Session, Depends(get_db)]
+# Scoped to the endpoint call so the commit happens before the response is sent
+DbSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
@@ -9,7 +9,8 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routers import health_router, reviews_router
-from app.db.migrations import run_migrations
+from app.cache import init_cache
+from app.db.migrations import check_schema_revision
 from app.db.session import Base, engine
 
 # Directory for uploaded files
@@ -18,15 +19,31 @@ UPLOADS_DIR = os.getenv("UPLOADS_DIR", "uploads")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Create database tables on startup and ensure uploads directory exists."""
-    # Run migrations for existing tables before create_all
-    run_migrations(engine)
-    Base.metadata.create_all(bind=engine)
+    """Check the database schema, set up caching and ensure uploads directory exists."""
+    async with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            # Local development databases are created straight from the models
+            await conn.run_sync(Base.metadata.create_all)
+        else:
+            # Schema is managed by Alembic (`alembic upgrade head`)
+            await conn.run_sync(check_schema_revision)
+    init_cache()
     # Ensure uploads directory exists
     Path(UPLOADS_DIR).mkdir(parents=True, exist_ok=True)
     yield
 
 
+def _assert_unique_routes(app: FastAPI) -> None:
+    """Fail fast if any path and method pair is registered more than once."""
+    seen: set[tuple[str, str]] = set()
+    for route in app.router.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (route.path, method)
+            if key in seen:
+                raise RuntimeError(f"Route registered twice: {method} {route.path}")
+            seen.add(key)
+
+
 app = FastAPI(
     title="Echo FastAPI",
     description="A CRUD API for sharing reviews of movies, TV shows, books, and plays.",
@@ -47,3 +64,6 @@ app.include_router(reviews_router)
 def root() -> dict:
     """Root endpoint."""
     return {"message": "Hello World"}
+
+
+_assert_unique_routes(app)
@@ -1,7 +1,7 @@
 """Review ORM model."""
 
 import enum
-from datetime import UTC, datetime
+from datetime import datetime
 
 from sqlalchemy import (
     BigInteger,
@@ -12,17 +12,13 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.session import Base
 
 
-def utc_now() -> datetime:
-    """Return current UTC time."""
-    return datetime.now(UTC)
-
-
 class MediaType(str, enum.Enum):
     """Enum for media types."""
 
@@ -47,14 +43,34 @@ class Review(Base):
     text: Mapped[str] = mapped_column(Text, nullable=False)
     contains_spoilers: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     image_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # insert_default renders now() into the INSERT itself, so tables created
+    # before the server defaults existed (e.g. old SQLite dev databases) still work
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        insert_default=func.now(),
+        nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        insert_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
     __table_args__ = (
-        Index("ix_reviews_media_title", "media_title"),
+        # Trigram index so substring (ILIKE '%...%') title search can use an index
+        Index(
+            "ix_reviews_media_title_trgm",
+            "media_title",
+            postgresql_using="gin",
+            postgresql_ops={"media_title": "gin_trgm_ops"},
+        ),
         Index("ix_reviews_media_type_title", "media_type", "media_title"),
+        Index("ix_reviews_media_type_id", "media_type", "id"),
     )
+
+    # Fetch server-generated columns from INSERT/UPDATE ... RETURNING instead
+    # of expiring them, so handlers can respond without a refresh round trip
+    __mapper_args__ = {"eager_defaults": True}
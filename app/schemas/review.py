@@ -8,16 +8,19 @@ from app.models.review import MediaType
 
 
 class ReviewCreate(BaseModel):
-    """Schema for creating a review."""
+    """Schema for creating a review.
 
-    author_name: str
-    author_telegram_id: int | None = None
+    Scalar fields are strict: JSON clients must send real numbers and booleans.
+    """
+
+    author_name: str = Field(..., strict=True)
+    author_telegram_id: int | None = Field(default=None, strict=True)
     media_type: MediaType
-    media_title: str
-    media_year: int | None = None
-    rating: int = Field(..., ge=1, le=10)
-    text: str
-    contains_spoilers: bool = False
+    media_title: str = Field(..., strict=True)
+    media_year: int | None = Field(default=None, strict=True)
+    rating: int = Field(..., ge=1, le=10, strict=True)
+    text: str = Field(..., strict=True)
+    contains_spoilers: bool = Field(default=False, strict=True)
 
 
 class ReviewCreateForm(BaseModel):
@@ -1,11 +1,35 @@
 """Async HTTP client for Reviews API."""
 
-from typing import Any
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, BinaryIO, Self
 
 import httpx
+import orjson
 
+from bot.config import get_settings
 from bot.exceptions import ApiBadRequest, ApiNotFound, ApiUnavailable, ApiValidationError
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Fail fast when the API host is unreachable, whatever the overall timeout
+CONNECT_TIMEOUT = 3.0
+
+# Keep idle connections long enough to span the pauses between user actions
+KEEPALIVE_EXPIRY = 60.0
+
+# Image checks only decide whether to try sending by URL, so they must be quick
+IMAGE_CHECK_TIMEOUT = 0.5
+
+# Filename escaping as in httpx multipart fields (plus DEL): quotes and control
+# characters are percent-encoded so a filename cannot break out of its header
+_MULTIPART_FILENAME_ESCAPES = str.maketrans(
+    {'"': "%22", "\\": "\\\\", "\x7f": "%7F"}
+    | {chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B}
+)
+
 
 class ReviewsApiClient:
     """Async HTTP client for interacting with the Reviews API."""
@@ -19,6 +43,43 @@ class ReviewsApiClient:
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across requests instead
+        of paying a new TCP handshake for every API call.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, CONNECT_TIMEOUT)),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
 
     async def _make_request(
         self,
@@ -42,10 +103,9 @@ class ReviewsApiClient:
             ApiBadRequest: Bad request
             ApiUnavailable: API unavailable
         """
-        url = f"{self.base_url}{path}"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(method, url, **kwargs)
+            # The client joins the path onto its base_url
+            response = await self._get_client().request(method, path, **kwargs)
         except httpx.TimeoutException as e:
             raise ApiUnavailable(f"Request timed out: {e}") from e
         except httpx.ConnectError as e:
@@ -55,6 +115,26 @@ class ReviewsApiClient:
 
         return self._handle_response(response)
 
+    async def _send_json(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any],
+    ) -> httpx.Response:
+        """Send a JSON body encoded once with orjson.
+
+        Args:
+            method: HTTP method (POST, PATCH)
+            path: API path (e.g., /reviews)
+            payload: JSON-serializable request body
+
+        Returns:
+            HTTP response
+        """
+        return await self._make_request(
+            method, path, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
+
     def _handle_response(self, response: httpx.Response) -> httpx.Response:
         """Handle HTTP response and raise appropriate exceptions.
 
@@ -76,17 +156,17 @@ class ReviewsApiClient:
 
         if response.status_code == 422:
             try:
-                data = response.json()
-                details = data.get("detail", [])
-                if isinstance(details, list):
-                    messages = [
-                        f"{err.get('loc', ['?'])[-1]}: {err.get('msg', 'error')}"
-                        for err in details
-                    ]
-                    raise ApiValidationError("Validation error", details=messages)
-                raise ApiValidationError(str(details))
-            except (ValueError, KeyError):
+                data = self._json(response) if response.content else {}
+            except orjson.JSONDecodeError:
                 raise ApiValidationError("Validation error")
+            details = data.get("detail", ()) if isinstance(data, dict) else ()
+            if isinstance(details, list):
+                messages = [
+                    f"{(err.get('loc') or ('?',))[-1]}: {err.get('msg', 'error')}"
+                    for err in details
+                ]
+                raise ApiValidationError("Validation error", details=messages)
+            raise ApiValidationError(str(details) if details else "Validation error")
 
         if response.status_code == 400:
             detail = self._extract_detail(response)
@@ -97,12 +177,17 @@ class ReviewsApiClient:
 
         return response
 
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body with orjson."""
+        return orjson.loads(response.content)
+
     def _extract_detail(self, response: httpx.Response) -> str:
         """Extract error detail from response."""
         try:
-            data = response.json()
+            data = self._json(response)
             return data.get("detail", "Unknown error")
-        except (ValueError, KeyError):
+        except (orjson.JSONDecodeError, ValueError, KeyError):
             return "Unknown error"
 
     async def create_review(
@@ -144,8 +229,8 @@ class ReviewsApiClient:
         if author_telegram_id is not None:
             payload["author_telegram_id"] = author_telegram_id
 
-        response = await self._make_request("POST", "/reviews/", json=payload)
-        return response.json()
+        response = await self._send_json("POST", "/reviews/", payload)
+        return self._json(response)
 
     async def list_reviews(
         self,
@@ -154,6 +239,7 @@ class ReviewsApiClient:
         media_type: str | None = None,
         min_rating: int | None = None,
         author_name: str | None = None,
+        media_title: str | None = None,
     ) -> list[dict[str, Any]]:
         """List reviews with optional filters.
 
@@ -163,6 +249,7 @@ class ReviewsApiClient:
             media_type: Filter by media type
             min_rating: Filter by minimum rating
             author_name: Filter by author name
+            media_title: Filter by case-insensitive title substring
 
         Returns:
             List of reviews
@@ -174,9 +261,11 @@ class ReviewsApiClient:
             params["min_rating"] = min_rating
         if author_name is not None:
             params["author_name"] = author_name
+        if media_title is not None:
+            params["media_title"] = media_title
 
         response = await self._make_request("GET", "/reviews/", params=params)
-        return response.json()
+        return self._json(response)
 
     async def get_review(self, review_id: int) -> dict[str, Any]:
         """Get a single review by ID.
@@ -188,7 +277,7 @@ class ReviewsApiClient:
             Review data
         """
         response = await self._make_request("GET", f"/reviews/{review_id}")
-        return response.json()
+        return self._json(response)
 
     async def update_review(
         self,
@@ -207,19 +296,12 @@ class ReviewsApiClient:
         """
         # Build payload, keeping None values only if they're explicitly meant to clear a field
         # The API's PATCH endpoint uses exclude_unset=True, so we need to send None explicitly
-        payload = {}
-        clear_fields = fields.pop("_clear_fields", [])
-        
-        for k, v in fields.items():
-            if v is not None:
-                payload[k] = v
-        
-        # Add fields to clear as None
-        for field in clear_fields:
-            payload[field] = None
-        
-        response = await self._make_request("PATCH", f"/reviews/{review_id}", json=payload)
-        return response.json()
+        clear_fields = fields.pop("_clear_fields", ())
+        payload = {k: v for k, v in fields.items() if v is not None}
+        payload.update(dict.fromkeys(clear_fields))
+
+        response = await self._send_json("PATCH", f"/reviews/{review_id}", payload)
+        return self._json(response)
 
     async def delete_review(self, review_id: int) -> None:
         """Delete a review.
@@ -232,7 +314,7 @@ class ReviewsApiClient:
     async def upload_review_image(
         self,
         review_id: int,
-        image_data: bytes,
+        image_data: bytes | BinaryIO | AsyncIterable[bytes],
         filename: str,
         content_type: str = "image/jpeg",
     ) -> dict[str, Any]:
@@ -240,20 +322,29 @@ class ReviewsApiClient:
 
         Args:
             review_id: Review ID
-            image_data: Image file content
+            image_data: Image file content, a binary file object, or an async
+                iterable of chunks that is sent while it is still being produced
             filename: Original filename
             content_type: MIME type of the image
 
         Returns:
             Updated review data with image URL
         """
-        files = {"file": (filename, image_data, content_type)}
-        response = await self._make_request(
-            "POST",
-            f"/reviews/{review_id}/image",
-            files=files,
-        )
-        return response.json()
+        path = f"/reviews/{review_id}/image"
+        if isinstance(image_data, AsyncIterable):
+            # httpx cannot stream async iterables as multipart fields, so the
+            # multipart body is framed by hand around the chunks
+            boundary = secrets.token_hex(16)
+            response = await self._make_request(
+                "POST",
+                path,
+                content=_multipart_file_body(boundary, filename, content_type, image_data),
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            )
+        else:
+            files = {"file": (filename, image_data, content_type)}
+            response = await self._make_request("POST", path, files=files)
+        return self._json(response)
 
     async def health_check(self) -> bool:
         """Check if the API is healthy.
@@ -263,7 +354,7 @@ class ReviewsApiClient:
         """
         try:
             response = await self._make_request("GET", "/health")
-            return response.json().get("status") == "healthy"
+            return self._json(response).get("status") == "healthy"
         except ApiUnavailable:
             return False
 
@@ -276,15 +367,28 @@ class ReviewsApiClient:
         Returns:
             Image bytes or None if failed
         """
-        url = f"{self.base_url}{image_url}"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    return response.content
-                return None
+            async with self._get_client().stream("GET", image_url) as response:
+                if response.status_code != 200:
+                    return None
+                return await response.aread()
+        except httpx.RequestError:
+            return None
+
+    async def image_exists(self, image_url: str) -> bool | None:
+        """Check with a HEAD request whether the API serves an image.
+
+        Args:
+            image_url: Image URL path (e.g., /uploads/reviews/1/image.jpg)
+
+        Returns:
+            Whether the image is served, or None if the check itself failed
+        """
+        try:
+            response = await self._get_client().head(image_url, timeout=IMAGE_CHECK_TIMEOUT)
         except httpx.RequestError:
             return None
+        return response.status_code == 200
 
     def get_absolute_image_url(self, image_url: str) -> str:
         """Build absolute URL for an image.
@@ -295,6 +399,38 @@ class ReviewsApiClient:
         Returns:
             Absolute URL
         """
-        if image_url.startswith("http"):
+        if image_url.startswith(("http://", "https://")):
             return image_url
         return f"{self.base_url}{image_url}"
+
+
+async def _multipart_file_body(
+    boundary: str,
+    filename: str,
+    content_type: str,
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[bytes]:
+    """Frame a stream of file chunks as a single-field multipart/form-data body."""
+    quoted_filename = filename.translate(_MULTIPART_FILENAME_ESCAPES)
+    yield (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{quoted_filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    async for chunk in chunks:
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+@lru_cache(maxsize=1)
+def get_api_client() -> ReviewsApiClient:
+    """Get the API client shared by all handlers. Override this in tests."""
+    settings = get_settings()
+    return ReviewsApiClient(settings.api_base_url, settings.request_timeout)
+
+
+async def close_api_client() -> None:
+    """Close the shared API client, if it was created."""
+    if get_api_client.cache_info().currsize:
+        await get_api_client().aclose()
+        get_api_client.cache_clear()
@@ -0,0 +1,320 @@
+"""Short-lived in-memory caches for Reviews API responses."""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from cachetools import TTLCache
+
+from bot.api_client import ReviewsApiClient
+from bot.utils.formatting import format_reviews_feed
+from bot.utils.tasks import spawn
+
+
+class AsyncTTLCache:
+    """TTL cache for coroutine results with single-flight loading.
+
+    Concurrent misses for the same key share one in-flight load instead of
+    each hitting the API.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached entries
+            ttl: Time-to-live for each entry in seconds
+        """
+        self._cache: TTLCache[Hashable, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for a key, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+
+        # Shield so one cancelled waiter does not cancel the shared load
+        return await asyncio.shield(task)
+
+    def _store(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Cache a finished load unless it was invalidated meanwhile."""
+        failed = task.cancelled() or task.exception() is not None
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        if not failed:
+            self._cache[key] = task.result()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for a key without loading it on a miss."""
+        return self._cache.get(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a key is cached or currently loading."""
+        return key in self._cache or key in self._inflight
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value loaded elsewhere, e.g. as part of a wider query."""
+        self._cache[key] = value
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry; a load for it already in flight is not cached."""
+        self._cache.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries; loads already in flight are not cached."""
+        self._cache.clear()
+        self._inflight.clear()
+
+
+class BytesLRUCache:
+    """LRU cache of byte strings bounded by their total size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached values in bytes
+        """
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Return a cached value and mark it as recently used."""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value, evicting least recently used entries to fit it."""
+        if len(value) > self.max_bytes:
+            return
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._total_bytes -= len(old)
+        self._data[key] = value
+        self._total_bytes += len(value)
+        while self._total_bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+        self._total_bytes = 0
+
+
+# Global caches of review list pages (keyed by query parameters) and single reviews
+reviews_list_cache = AsyncTTLCache(maxsize=512, ttl=5)
+review_cache = AsyncTTLCache(maxsize=2048, ttl=10)
+
+# Downloaded review images; image URLs are unique per upload, so entries never go stale
+image_cache = BytesLRUCache(max_bytes=64 * 1024 * 1024)
+
+# Image URLs the API was recently confirmed to serve, from a HEAD check before
+# sending them by URL; misses are not recorded, as a new upload may not be
+# visible yet
+image_checks: TTLCache[str, bool] = TTLCache(maxsize=4096, ttl=600)
+
+# Users who triggered a prefetch recently; limits prefetching to one per second each
+_recent_prefetches: TTLCache[int, bool] = TTLCache(maxsize=10_000, ttl=1)
+
+# Rendered feed text for cached pages, keyed by the identity of the page list
+_feed_texts: TTLCache[int, tuple[list[dict[str, Any]], str]] = TTLCache(maxsize=512, ttl=5)
+
+
+def _seed_review_cache(reviews: list[dict[str, Any]]) -> None:
+    """Cache reviews from a list page so opening one needs no extra request.
+
+    List items carry the same fields as single reviews. Entries already
+    cached are kept, as they may be fresher than the page.
+    """
+    for review in reviews:
+        review_id = review.get("id")
+        if review_id is not None and review_id not in review_cache:
+            review_cache.set(review_id, review)
+
+
+def _list_key(params: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    """Build the page cache key for list_reviews arguments."""
+    return tuple(sorted(params.items()))
+
+
+async def cached_list_reviews(client: ReviewsApiClient, **params: Any) -> list[dict[str, Any]]:
+    """List reviews through the page cache.
+
+    Args:
+        client: API client used on a cache miss
+        **params: Arguments for ReviewsApiClient.list_reviews
+
+    Returns:
+        List of reviews
+    """
+
+    async def load_page() -> list[dict[str, Any]]:
+        reviews = await client.list_reviews(**params)
+        _seed_review_cache(reviews)
+        return reviews
+
+    return await reviews_list_cache.get_or_load(_list_key(params), load_page)
+
+
+async def cached_list_reviews_window(
+    client: ReviewsApiClient,
+    limit: int,
+    offset: int,
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """List a feed page, loading it together with the following page on a miss.
+
+    One request for twice the page size fills both cache entries, so paging
+    forward costs a single round-trip per two pages.
+
+    Args:
+        client: API client used on a cache miss
+        limit: Page size
+        offset: Page offset
+        **filters: Filter arguments for ReviewsApiClient.list_reviews
+
+    Returns:
+        List of reviews on the requested page
+    """
+    key = _list_key({"limit": limit, "offset": offset, **filters})
+
+    async def load_window() -> list[dict[str, Any]]:
+        window = await client.list_reviews(limit=limit * 2, offset=offset, **filters)
+        _seed_review_cache(window)
+        # Skip seeding if the cache was invalidated while loading
+        if key in reviews_list_cache:
+            next_key = _list_key({"limit": limit, "offset": offset + limit, **filters})
+            reviews_list_cache.set(next_key, window[limit:])
+        return window[:limit]
+
+    return await reviews_list_cache.get_or_load(key, load_window)
+
+
+def prefetch_list_reviews(client: ReviewsApiClient, user_id: int, **params: Any) -> None:
+    """Warm the page cache in the background, e.g. with the next feed page.
+
+    Args:
+        client: API client used to load the page
+        user_id: Telegram user the prefetch is made for
+        **params: Arguments for ReviewsApiClient.list_reviews
+    """
+    if user_id in _recent_prefetches or _list_key(params) in reviews_list_cache:
+        return
+    _recent_prefetches[user_id] = True
+    spawn(cached_list_reviews(client, **params))
+
+
+async def cached_get_review(client: ReviewsApiClient, review_id: int) -> dict[str, Any]:
+    """Get a single review through the review cache.
+
+    Args:
+        client: API client used on a cache miss
+        review_id: Review ID
+
+    Returns:
+        Review data
+    """
+    return await review_cache.get_or_load(review_id, lambda: client.get_review(review_id))
+
+
+async def cached_download_image(client: ReviewsApiClient, image_url: str) -> bytes | None:
+    """Download a review image through the image cache.
+
+    Args:
+        client: API client used on a cache miss
+        image_url: Image URL path (e.g., /uploads/reviews/1/image.jpg)
+
+    Returns:
+        Image bytes or None if the download failed
+    """
+    image_data = image_cache.get(image_url)
+    if image_data is None:
+        image_data = await client.download_image(image_url)
+        if image_data:
+            image_cache.set(image_url, image_data)
+    return image_data
+
+
+async def cached_image_exists(client: ReviewsApiClient, image_url: str) -> bool | None:
+    """Check whether the API serves an image, reusing recent positive answers.
+
+    Args:
+        client: API client used on a cache miss
+        image_url: Image URL path (e.g., /uploads/reviews/1/image.jpg)
+
+    Returns:
+        Whether the image is served, or None if it could not be checked
+    """
+    if image_url in image_checks:
+        return True
+    exists = await client.image_exists(image_url)
+    if exists:
+        image_checks[image_url] = True
+    return exists
+
+
+def cached_format_reviews_feed(reviews: list[dict[str, Any]]) -> str:
+    """Format a feed page, reusing the text rendered for the same cached page.
+
+    Pages served from the list cache are the same list object on every hit,
+    so repeated renders skip escaping and formatting each summary.
+
+    Args:
+        reviews: Reviews on the page, as returned by the list cache
+
+    Returns:
+        Formatted HTML feed text
+    """
+    entry = _feed_texts.get(id(reviews))
+    # The entry holds the page itself, so a matching id cannot be a reused one
+    if entry is not None and entry[0] is reviews:
+        return entry[1]
+    text = format_reviews_feed(reviews)
+    _feed_texts[id(reviews)] = (reviews, text)
+    return text
+
+
+def peek_cached_review(review_id: int) -> dict[str, Any] | None:
+    """Return a review if it is cached, without requesting it on a miss."""
+    return review_cache.get(review_id)
+
+
+def invalidate_review_caches(review_id: int | None = None) -> None:
+    """Drop cached review data after a review is created, changed or deleted.
+
+    Args:
+        review_id: Review that changed; all cached reviews are dropped if None
+    """
+    reviews_list_cache.clear()
+    _feed_texts.clear()
+    if review_id is None:
+        review_cache.clear()
+        image_checks.clear()
+        return
+    review = review_cache.get(review_id)
+    if review is not None and review.get("image_url"):
+        image_checks.pop(review["image_url"], None)
+    review_cache.pop(review_id)
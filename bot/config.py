@@ -1,5 +1,7 @@
 """Bot configuration using pydantic-settings."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -39,6 +41,7 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get bot settings instance."""
+    """Get the bot settings instance, loaded once per process."""
     return Settings()
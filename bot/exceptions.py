@@ -4,6 +4,9 @@
 class ApiError(Exception):
     """Base exception for API errors."""
 
+    message: str
+    status_code: int | None
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         """Initialize API error."""
         self.message = message
@@ -22,7 +25,9 @@ class ApiNotFound(ApiError):
 class ApiValidationError(ApiError):
     """Validation error (422)."""
 
-    def __init__(self, message: str = "Validation error", details: list | None = None) -> None:
+    details: list[str]
+
+    def __init__(self, message: str = "Validation error", details: list[str] | None = None) -> None:
         """Initialize validation error."""
         self.details = details or []
         super().__init__(message, status_code=422)
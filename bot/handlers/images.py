@@ -2,32 +2,30 @@
 
 import re
 
-from aiogram import F, Router
+from aiogram import Bot, F, Router
 from aiogram.types import Message
 
-from bot.api_client import ReviewsApiClient
+from bot.api_client import get_api_client
+from bot.cache import invalidate_review_caches
 from bot.exceptions import ApiNotFound, ApiUnavailable
 from bot.i18n import ru
 from bot.logging_config import get_logger
-from bot.rate_limiter import rate_limiter
+from bot.utils.files import stream_telegram_file
 from bot.utils.formatting import format_error, format_review_updated
 
 logger = get_logger(__name__)
 
 router = Router()
 
-
-def get_api_client() -> ReviewsApiClient:
-    """Get API client instance. Override this in tests."""
-    from bot.config import get_settings
-    settings = get_settings()
-    return ReviewsApiClient(settings.api_base_url, settings.request_timeout)
+# "Review #123" / "Отзыв #123", "ID: 123" or "#123" at the start of a line
+_RE_REVIEW_ID = re.compile(r"(?:Review|Отзыв) #(\d+)|ID:\s*(\d+)|^#(\d+)", re.MULTILINE)
 
 
 def extract_review_id_from_message(text: str | None) -> int | None:
     """Extract review ID from a message text.
     
-    Looks for patterns like "Review #123", "Отзыв #123" or "ID: 123".
+    Looks for patterns like "Review #123", "Отзыв #123" or "ID: 123" and
+    returns the earliest one in the text.
     
     Args:
         text: Message text to search
@@ -35,28 +33,19 @@ def extract_review_id_from_message(text: str | None) -> int | None:
     Returns:
         Review ID if found, None otherwise
     """
-    if not text:
+    # Every supported pattern contains "#" or "ID"; skip the regex otherwise
+    if not text or ("#" not in text and "ID" not in text):
         return None
     
-    # Look for "Review #123" or "Отзыв #123" pattern
-    match = re.search(r"(?:Review|Отзыв) #(\d+)", text)
-    if match:
-        return int(match.group(1))
-    
-    # Look for "ID: 123" pattern
-    match = re.search(r"ID:\s*(\d+)", text)
-    if match:
-        return int(match.group(1))
-    
-    # Look for "#123" at start of line
-    match = re.search(r"^#(\d+)", text, re.MULTILINE)
+    # Single pass over the text; the first alternative that matched wins
+    match = _RE_REVIEW_ID.search(text)
     if match:
-        return int(match.group(1))
-    
+        return int(next(group for group in match.groups() if group))
+
     return None
 
 
-@router.message(F.photo, F.reply_to_message)
+@router.message(F.photo, F.reply_to_message, flags={"rate_limit": True})
 async def handle_photo_reply(message: Message) -> None:
     """Handle photo replies to upload image to a review.
     
@@ -66,14 +55,6 @@ async def handle_photo_reply(message: Message) -> None:
     if not message.from_user or not message.reply_to_message:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
     # Get the text from the replied message
     reply_text = message.reply_to_message.text or message.reply_to_message.caption
     review_id = extract_review_id_from_message(reply_text)
@@ -90,31 +71,25 @@ async def handle_photo_reply(message: Message) -> None:
     
     try:
         # Download the photo
-        from aiogram import Bot
         bot: Bot = message.bot  # type: ignore
+        client = get_api_client()
+        # A missing review is reported by the upload itself (ApiNotFound)
         file = await bot.get_file(photo.file_id)
         if not file.file_path:
             await message.answer(format_error(ru.ERR_FAILED_TO_DOWNLOAD_IMAGE), parse_mode="HTML")
             return
         
-        file_content = await bot.download_file(file.file_path)
-        if not file_content:
-            await message.answer(format_error(ru.ERR_FAILED_TO_DOWNLOAD_IMAGE), parse_mode="HTML")
-            return
-        
-        image_data = file_content.read()
-        
         # Determine filename
         filename = f"telegram_photo_{photo.file_id[-8:]}.jpg"
         
-        # Upload to the API
-        client = get_api_client()
+        # Upload to the API while the photo is still downloading
         review = await client.upload_review_image(
             review_id=review_id,
-            image_data=image_data,
+            image_data=stream_telegram_file(bot, file.file_path),
             filename=filename,
             content_type="image/jpeg",
         )
+        invalidate_review_caches(review_id)
         
         await message.answer(
             f"{ru.MSG_IMAGE_UPLOADED}\n\n{format_review_updated(review)}",
@@ -1,5 +1,7 @@
 """Review CRUD handlers with Russian UI and button-driven flows."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from aiogram import F, Router
@@ -9,11 +11,27 @@ from aiogram.enums import ContentType
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import BufferedInputFile, CallbackQuery, Message, User
 
-from bot.api_client import ReviewsApiClient
+from bot.api_client import ReviewsApiClient, get_api_client
+from bot.cache import (
+    cached_download_image,
+    cached_format_reviews_feed,
+    cached_get_review,
+    cached_image_exists,
+    cached_list_reviews,
+    cached_list_reviews_window,
+    invalidate_review_caches,
+    peek_cached_review,
+    prefetch_list_reviews,
+)
 from bot.config import get_settings
-from bot.exceptions import ApiBadRequest, ApiNotFound, ApiUnavailable, ApiValidationError
+from bot.exceptions import ApiBadRequest, ApiError, ApiNotFound, ApiUnavailable, ApiValidationError
 from bot.i18n import ru
 from bot.keyboards import (
+    MediaTypeFilterCallback,
+    MinRatingFilterCallback,
+    PageCallback,
+    PhotoActionCallback,
+    ReviewActionCallback,
     ReviewListCallback,
     ReviewOpenCallback,
     add_image_keyboard,
@@ -29,9 +47,9 @@ from bot.keyboards import (
     review_actions_keyboard,
     skip_keyboard,
     spoilers_keyboard,
+    unescape_filter_param,
 )
 from bot.logging_config import get_logger
-from bot.rate_limiter import rate_limiter
 from bot.states import (
     ReviewCreateStates,
     ReviewDeleteStates,
@@ -39,42 +57,83 @@ from bot.states import (
     ReviewFindStates,
     ReviewPhotoStates,
 )
+from bot.utils.files import stream_telegram_file
 from bot.utils.formatting import (
     format_error,
     format_photo_caption,
     format_review_created,
     format_review_deleted,
     format_review_detail,
-    format_review_summary,
     format_review_updated,
     get_author_name,
 )
+from bot.utils.tasks import spawn
 
 logger = get_logger(__name__)
 
 router = Router()
 
+# Accepted media years, inclusive of 2100
+_YEAR_RANGE = range(1800, 2101)
 
-def get_api_client() -> ReviewsApiClient:
-    """Get API client instance. Override this in tests."""
-    settings = get_settings()
-    return ReviewsApiClient(settings.api_base_url, settings.request_timeout)
+# Media types accepted as the bare /reviews argument
+_MEDIA_TYPES = frozenset({"movie", "tv", "book", "play"})
 
+# /reviews key=value arguments: the list_reviews filter each sets and its parser
+_FILTER_PARSERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "min_rating": ("min_rating", int),
+    "author": ("author_name", str),
+}
 
-async def handle_api_error(message: Message, error: Exception) -> None:
-    """Handle API errors with user-friendly messages (Russian)."""
+
+def format_api_error(error: Exception) -> str:
+    """Build a user-friendly (Russian) error message for a failed API call.
+    
+    Anything that is not a known API error gets the generic message, so
+    internal exception text never reaches the user.
+    """
     if isinstance(error, ApiNotFound):
-        await message.answer(format_error(ru.ERR_REVIEW_NOT_FOUND), parse_mode="HTML")
-    elif isinstance(error, ApiValidationError):
+        return format_error(ru.ERR_REVIEW_NOT_FOUND)
+    if isinstance(error, ApiValidationError):
         details = "\n".join(error.details) if error.details else error.message
-        await message.answer(format_error(ru.ERR_VALIDATION.format(details)), parse_mode="HTML")
-    elif isinstance(error, ApiBadRequest):
-        await message.answer(format_error(error.message), parse_mode="HTML")
-    elif isinstance(error, ApiUnavailable):
-        await message.answer(format_error(ru.ERR_API_UNAVAILABLE), parse_mode="HTML")
-    else:
+        return format_error(ru.ERR_VALIDATION.format(details))
+    if isinstance(error, ApiBadRequest):
+        return format_error(error.message)
+    if isinstance(error, ApiUnavailable):
+        return format_error(ru.ERR_API_UNAVAILABLE)
+    return format_error(ru.ERR_UNEXPECTED)
+
+
+async def handle_api_error(message: Message, error: Exception) -> None:
+    """Handle API errors with user-friendly messages (Russian)."""
+    if not isinstance(error, (ApiNotFound, ApiValidationError, ApiBadRequest, ApiUnavailable)):
         logger.exception("Unexpected error")
-        await message.answer(format_error(ru.ERR_UNEXPECTED), parse_mode="HTML")
+    await message.answer(format_api_error(error), parse_mode="HTML")
+
+
+def log_handler_error(event: str, error: Exception) -> None:
+    """Log a failed handler action.
+    
+    API errors are expected (missing reviews, validation, outages) and are
+    logged without a traceback; anything else is logged in full.
+    
+    Args:
+        event: Short description of what failed
+        error: The caught exception
+    """
+    if isinstance(error, ApiError):
+        logger.warning("%s: %s (status %s)", event, error.message, error.status_code)
+    else:
+        logger.exception(event)
+
+
+def _ack(callback: CallbackQuery) -> None:
+    """Answer a callback query in the background.
+    
+    Used once the handler has already updated the message, so the user sees
+    the result without waiting for the acknowledgement round trip.
+    """
+    spawn(callback.answer())
 
 
 def is_review_author(user_id: int | None, review: dict[str, Any]) -> bool:
@@ -93,6 +152,36 @@ def is_review_author(user_id: int | None, review: dict[str, Any]) -> bool:
     return author_telegram_id is not None and author_telegram_id == user_id
 
 
+def _safe_int(text: str) -> int | None:
+    """Parse user-typed text as an integer without raising on bad input.
+    
+    Args:
+        text: Text to parse, surrounding whitespace allowed
+        
+    Returns:
+        Parsed integer, or None if the text is not a plain ASCII integer
+    """
+    text = text.strip()
+    digits = text[1:] if text.startswith("-") else text
+    # isdigit alone also accepts digits int() rejects, such as superscripts
+    return int(text) if digits.isascii() and digits.isdigit() else None
+
+
+def _parse_pos_int(text: str) -> int | None:
+    """Parse an ID such as a review ID from user input or callback data.
+    
+    Args:
+        text: Text to parse, surrounding whitespace allowed
+        
+    Returns:
+        Parsed non-negative integer, or None unless the text is 1-10 ASCII digits
+    """
+    text = text.strip()
+    if not 0 < len(text) <= 10 or not (text.isascii() and text.isdigit()):
+        return None
+    return int(text)
+
+
 async def send_or_edit_text_from_callback(
     callback: CallbackQuery,
     text: str,
@@ -137,6 +226,7 @@ async def send_review_with_image(
     client: ReviewsApiClient,
     is_author: bool = True,
     show_back_button: bool = False,
+    image_url: str | None = None,
 ) -> bool:
     """Send a review with its image. Returns True if image was sent successfully.
     
@@ -149,8 +239,9 @@ async def send_review_with_image(
         client: API client for downloading images
         is_author: Whether current user is the author (controls edit/delete buttons)
         show_back_button: Whether to show back to list button
+        image_url: Review image URL if the caller already looked it up
     """
-    image_url = review.get("image_url")
+    image_url = image_url or review.get("image_url")
     if not image_url:
         return False
     
@@ -175,7 +266,7 @@ async def send_review_with_image(
     photo_sent = False
     
     if settings.bot_image_mode == "reupload":
-        image_data = await client.download_image(image_url)
+        image_data = await cached_download_image(client, image_url)
         if image_data:
             try:
                 photo = BufferedInputFile(image_data, filename="review_image.jpg")
@@ -203,7 +294,7 @@ async def send_review_with_image(
                 photo_sent = True
             except Exception as e:
                 logger.warning(f"Failed to send re-uploaded image: {e}")
-    else:
+    elif await cached_image_exists(client, image_url) is not False:
         full_url = client.get_absolute_image_url(image_url)
         try:
             if needs_separate_message:
@@ -236,13 +327,13 @@ async def send_review_with_image(
 
 # ============== BUTTON HANDLERS FOR MAIN MENU ==============
 
-@router.message(F.text == ru.BTN_ADD_REVIEW)
+@router.message(F.text == ru.BTN_ADD_REVIEW, flags={"rate_limit": True})
 async def btn_add_review(message: Message, state: FSMContext) -> None:
     """Handle add review button."""
     await start_review_creation(message, state)
 
 
-@router.message(F.text == ru.BTN_FEED)
+@router.message(F.text == ru.BTN_FEED, flags={"rate_limit": True})
 async def btn_feed(message: Message) -> None:
     """Handle feed button."""
     await show_reviews_feed(message)
@@ -251,8 +342,9 @@ async def btn_feed(message: Message) -> None:
 @router.message(F.text == ru.BTN_FIND)
 async def btn_find(message: Message, state: FSMContext) -> None:
     """Handle find button."""
-    await state.clear()
     await state.set_state(ReviewFindStates.select_method)
+    # set_data replaces any previous data, so no separate clear() is needed
+    await state.set_data({})
     await message.answer(
         ru.PROMPT_FIND_METHOD,
         parse_mode="HTML",
@@ -267,16 +359,8 @@ async def start_review_creation(message: Message, state: FSMContext) -> None:
     if not message.from_user:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
-    await state.clear()
     await state.set_state(ReviewCreateStates.media_type)
+    await state.set_data({})
     await message.answer(
         ru.PROMPT_CREATE_START,
         reply_markup=media_type_keyboard(),
@@ -284,7 +368,7 @@ async def start_review_creation(message: Message, state: FSMContext) -> None:
     )
 
 
-@router.message(Command("review_new"))
+@router.message(Command("review_new"), flags={"rate_limit": True})
 async def cmd_review_new(message: Message, state: FSMContext) -> None:
     """Start the review creation flow (command)."""
     await start_review_creation(message, state)
@@ -296,7 +380,7 @@ async def process_media_type(callback: CallbackQuery, state: FSMContext) -> None
     if not callback.data or not callback.message:
         return
     
-    media_type = callback.data.split(":")[1]
+    media_type = callback.data.partition(":")[2]
     media_type_display = ru.FMT_MEDIA_TYPE.get(media_type, media_type)
     await state.update_data(media_type=media_type)
     await state.set_state(ReviewCreateStates.media_title)
@@ -347,14 +431,13 @@ async def process_media_year(message: Message, state: FSMContext) -> None:
         await message.answer(ru.PROMPT_ENTER_YEAR_TEXT)
         return
     
-    try:
-        year = int(message.text.strip())
-        if year < 1800 or year > 2100:
-            await message.answer(ru.PROMPT_ENTER_VALID_YEAR)
-            return
-    except ValueError:
+    year = _safe_int(message.text)
+    if year is None:
         await message.answer(ru.PROMPT_ENTER_VALID_YEAR_NUMBER)
         return
+    if year not in _YEAR_RANGE:
+        await message.answer(ru.PROMPT_ENTER_VALID_YEAR)
+        return
     
     await state.update_data(media_year=year)
     await state.set_state(ReviewCreateStates.rating)
@@ -371,7 +454,7 @@ async def process_rating(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    rating = int(callback.data.split(":")[1])
+    rating = int(callback.data.partition(":")[2])
     await state.update_data(rating=rating)
     await state.set_state(ReviewCreateStates.contains_spoilers)
     
@@ -388,7 +471,7 @@ async def process_spoilers(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    contains_spoilers = callback.data.split(":")[1] == "yes"
+    contains_spoilers = callback.data.partition(":")[2] == "yes"
     await state.update_data(contains_spoilers=contains_spoilers)
     await state.set_state(ReviewCreateStates.text)
     
@@ -418,7 +501,7 @@ async def process_add_image_choice(callback: CallbackQuery, state: FSMContext) -
     if not callback.data or not callback.message or not callback.from_user:
         return
     
-    choice = callback.data.split(":")[1]
+    choice = callback.data.partition(":")[2]
     
     if choice == "yes":
         await state.set_state(ReviewCreateStates.waiting_for_image)
@@ -463,6 +546,14 @@ async def create_review_from_state(
     author_name = get_author_name(user)
     author_telegram_id = user.id
     
+    bot = message_or_callback.bot
+    # Resolve the Telegram file while the review is being created
+    file_task = (
+        asyncio.ensure_future(bot.get_file(photo_file_id))
+        if photo_file_id and bot is not None
+        else None
+    )
+    
     try:
         client = get_api_client()
         review = await client.create_review(
@@ -476,23 +567,20 @@ async def create_review_from_state(
             author_telegram_id=author_telegram_id,
         )
         
-        if photo_file_id and message_or_callback.bot is not None:
+        if file_task is not None:
             try:
-                bot = message_or_callback.bot
-                file = await bot.get_file(photo_file_id)
+                file = await file_task
                 if file.file_path:
-                    file_content = await bot.download_file(file.file_path)
-                    if file_content:
-                        image_data = file_content.read()
-                        await client.upload_review_image(
-                            review_id=review["id"],
-                            image_data=image_data,
-                            filename=f"review_{review['id']}.jpg",
-                            content_type="image/jpeg",
-                        )
+                    await client.upload_review_image(
+                        review_id=review["id"],
+                        image_data=stream_telegram_file(bot, file.file_path),
+                        filename=f"review_{review['id']}.jpg",
+                        content_type="image/jpeg",
+                    )
             except Exception as e:
                 logger.warning(f"Failed to upload image: {e}")
         
+        invalidate_review_caches(review["id"])
         await message_or_callback.answer(
             format_review_created(review),
             parse_mode="HTML",
@@ -500,10 +588,44 @@ async def create_review_from_state(
         )
     except Exception as e:
         await handle_api_error(message_or_callback, e)
+    finally:
+        if file_task is not None:
+            if not file_task.done():
+                # Still pending only if creating the review failed
+                file_task.cancel()
+            elif not file_task.cancelled():
+                # Retrieve a lookup failure nobody awaited so asyncio does not log it
+                file_task.exception()
 
 
 # ============== LIST REVIEWS / FEED ==============
 
+async def _render_feed(
+    message: Message,
+    reviews: list[dict[str, Any]],
+    offset: int,
+    limit: int,
+    filter_param: str = "",
+    edit: bool = False,
+) -> None:
+    """Send a feed page with its pagination keyboard.
+    
+    Args:
+        message: Message to answer, or to edit in place when edit is True
+        reviews: Reviews on the page (must not be empty)
+        offset: Offset of the page
+        limit: Page size
+        filter_param: Active filter, kept in the pagination buttons
+        edit: Whether to edit the message instead of sending a new one
+    """
+    text = cached_format_reviews_feed(reviews)
+    keyboard = pagination_keyboard(offset, limit, len(reviews), filter_param, reviews=reviews)
+    if edit:
+        await message.edit_text(text, parse_mode="HTML", reply_markup=keyboard)
+    else:
+        await message.answer(text, parse_mode="HTML", reply_markup=keyboard)
+
+
 async def show_reviews_feed(
     message: Message,
     offset: int = 0,
@@ -515,72 +637,61 @@ async def show_reviews_feed(
     if not message.from_user:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
     filters = filters or {}
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=limit, offset=offset, **filters)
+        reviews = await cached_list_reviews(client, limit=limit, offset=offset, **filters)
         
         if not reviews:
             await message.answer(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(offset, limit, len(reviews), filter_param, reviews=reviews)
-        await message.answer("\n".join(lines), parse_mode="HTML", reply_markup=keyboard)
+        await _render_feed(message, reviews, offset, limit, filter_param)
+        if len(reviews) >= limit:
+            prefetch_list_reviews(
+                client, message.from_user.id, limit=limit, offset=offset + limit, **filters
+            )
     except Exception as e:
         await handle_api_error(message, e)
 
 
-@router.message(Command("reviews"))
+@router.message(Command("reviews"), flags={"rate_limit": True})
 async def cmd_reviews(message: Message, command: CommandObject) -> None:
     """List reviews with optional filters (command)."""
     args = command.args or ""
     filters: dict[str, Any] = {}
     filter_param = ""
     
-    if args and args.lower() in ("movie", "tv", "book", "play"):
-        filters["media_type"] = args.lower()
-        filter_param = f"media_type={args.lower()}"
+    media_type = args.lower()
+    if media_type in _MEDIA_TYPES:
+        filters["media_type"] = media_type
+        filter_param = f"media_type={media_type}"
     else:
         for part in args.split():
-            if "=" in part:
-                key, value = part.split("=", 1)
-                if key == "min_rating":
-                    try:
-                        filters["min_rating"] = int(value)
-                        filter_param = f"min_rating={value}"
-                    except ValueError:
-                        pass
-                elif key == "author":
-                    filters["author_name"] = value
-                    filter_param = f"author_name={value}"
+            key, sep, value = part.partition("=")
+            entry = _FILTER_PARSERS.get(key) if sep else None
+            if entry is None:
+                continue
+            name, parse = entry
+            try:
+                filters[name] = parse(value)
+            except ValueError:
+                continue
+            filter_param = f"{name}={value}"
     
     await show_reviews_feed(message, filters=filters, filter_param=filter_param)
 
 
-@router.callback_query(F.data.startswith("page:"))
-async def handle_pagination(callback: CallbackQuery) -> None:
+@router.callback_query(PageCallback.filter())
+async def handle_pagination(callback: CallbackQuery, callback_data: PageCallback) -> None:
     """Handle pagination button clicks."""
-    if not callback.data or not callback.message:
+    if not callback.message:
         return
     
-    parts = callback.data.split(":")
-    offset = int(parts[1])
-    limit = int(parts[2])
-    filter_param = parts[3] if len(parts) > 3 else ""
+    offset = callback_data.offset
+    limit = callback_data.limit
+    filter_param = unescape_filter_param(callback_data.filter_param)
     
     filters: dict[str, Any] = {}
     if filter_param:
@@ -594,26 +705,20 @@ async def handle_pagination(callback: CallbackQuery) -> None:
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=limit, offset=offset, **filters)
+        reviews = await cached_list_reviews_window(client, limit, offset, **filters)
         
         if not reviews:
             await callback.answer(ru.PROMPT_NO_MORE_REVIEWS)
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(offset, limit, len(reviews), filter_param, reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, offset, limit, filter_param, edit=True)
         await callback.answer()
+        if len(reviews) >= limit:
+            prefetch_list_reviews(
+                client, callback.from_user.id, limit=limit, offset=offset + limit, **filters
+            )
     except Exception as e:
-        logger.exception("Pagination error")
+        log_handler_error("Pagination error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
@@ -633,76 +738,80 @@ async def open_filter_menu(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("filter:type:"))
-async def apply_type_filter(callback: CallbackQuery) -> None:
+@router.callback_query(MediaTypeFilterCallback.filter())
+async def apply_type_filter(callback: CallbackQuery, callback_data: MediaTypeFilterCallback) -> None:
     """Apply media type filter."""
-    if not callback.data or not callback.message:
+    if not callback.message:
         return
     
-    media_type = callback.data.split(":")[2]
+    media_type = callback_data.media_type
     filter_param = f"media_type={media_type}"
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=0, media_type=media_type)
+        reviews = await cached_list_reviews(client, limit=5, offset=0, media_type=media_type)
         
         if not reviews:
             await callback.message.edit_text(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(0, 5, len(reviews), filter_param, reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, 0, 5, filter_param, edit=True)
         await callback.answer()
     except Exception as e:
-        logger.exception("Filter error")
+        log_handler_error("Filter error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
-@router.callback_query(F.data.startswith("filter:rating:"))
-async def apply_rating_filter(callback: CallbackQuery) -> None:
+@router.callback_query(MinRatingFilterCallback.filter())
+async def apply_rating_filter(callback: CallbackQuery, callback_data: MinRatingFilterCallback) -> None:
     """Apply minimum rating filter."""
-    if not callback.data or not callback.message:
+    if not callback.message:
         return
     
-    min_rating = int(callback.data.split(":")[2])
+    min_rating = callback_data.min_rating
     filter_param = f"min_rating={min_rating}"
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=0, min_rating=min_rating)
+        reviews = await cached_list_reviews(client, limit=5, offset=0, min_rating=min_rating)
         
         if not reviews:
             await callback.message.edit_text(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(0, 5, len(reviews), filter_param, reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, 0, 5, filter_param, edit=True)
         await callback.answer()
     except Exception as e:
-        logger.exception("Filter error")
+        log_handler_error("Filter error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
+# Buttons on messages sent before the typed callback data above used
+# "filter:type:<type>", "filter:rating:<n>" and "page:<offset>:<limit>"
+
+@router.callback_query(F.data.regexp(r"^filter:type:(movie|tv|book|play)$"))
+async def apply_legacy_type_filter(callback: CallbackQuery) -> None:
+    """Apply media type filter from a legacy button."""
+    media_type = callback.data.rpartition(":")[2]
+    await apply_type_filter(callback, MediaTypeFilterCallback(media_type=media_type))
+
+
+@router.callback_query(F.data.regexp(r"^filter:rating:\d{1,2}$"))
+async def apply_legacy_rating_filter(callback: CallbackQuery) -> None:
+    """Apply minimum rating filter from a legacy button."""
+    min_rating = int(callback.data.rpartition(":")[2])
+    await apply_rating_filter(callback, MinRatingFilterCallback(min_rating=min_rating))
+
+
+@router.callback_query(F.data.regexp(r"^page:\d{1,6}:\d{1,2}$"))
+async def handle_legacy_pagination(callback: CallbackQuery) -> None:
+    """Handle an unfiltered legacy pagination button."""
+    _, offset, limit = callback.data.split(":")
+    await handle_pagination(callback, PageCallback(offset=int(offset), limit=int(limit)))
+
+
 @router.callback_query(F.data == "filter:my")
 async def apply_my_filter(callback: CallbackQuery) -> None:
     """Apply 'my reviews only' filter."""
@@ -714,27 +823,17 @@ async def apply_my_filter(callback: CallbackQuery) -> None:
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=0, author_name=author_name)
+        reviews = await cached_list_reviews(client, limit=5, offset=0, author_name=author_name)
         
         if not reviews:
             await callback.message.edit_text(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(0, 5, len(reviews), filter_param, reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, 0, 5, filter_param, edit=True)
         await callback.answer()
     except Exception as e:
-        logger.exception("Filter error")
+        log_handler_error("Filter error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
@@ -746,27 +845,17 @@ async def reset_filter(callback: CallbackQuery) -> None:
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=0)
+        reviews = await cached_list_reviews(client, limit=5, offset=0)
         
         if not reviews:
             await callback.message.edit_text(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(0, 5, len(reviews), reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, 0, 5, edit=True)
         await callback.answer()
     except Exception as e:
-        logger.exception("Reset filter error")
+        log_handler_error("Reset filter error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
@@ -778,27 +867,17 @@ async def cancel_filter(callback: CallbackQuery) -> None:
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=0)
+        reviews = await cached_list_reviews(client, limit=5, offset=0)
         
         if not reviews:
             await callback.message.edit_text(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
-        keyboard = pagination_keyboard(0, 5, len(reviews), reviews=reviews)
-        await callback.message.edit_text(
-            "\n".join(lines),
-            parse_mode="HTML",
-            reply_markup=keyboard,
-        )
+        await _render_feed(callback.message, reviews, 0, 5, edit=True)
         await callback.answer()
     except Exception as e:
-        logger.exception("Cancel filter error")
+        log_handler_error("Cancel filter error", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
@@ -810,7 +889,7 @@ async def process_find_method(callback: CallbackQuery, state: FSMContext) -> Non
     if not callback.data or not callback.message:
         return
     
-    method = callback.data.split(":")[1]
+    method = callback.data.partition(":")[2]
     
     if method == "cancel":
         await state.clear()
@@ -835,9 +914,8 @@ async def find_by_id(message: Message, state: FSMContext) -> None:
         await message.answer(ru.PROMPT_FIND_INVALID_ID)
         return
     
-    try:
-        review_id = int(message.text.strip())
-    except ValueError:
+    review_id = _parse_pos_int(message.text)
+    if review_id is None:
         await message.answer(ru.PROMPT_FIND_INVALID_ID)
         return
     
@@ -856,24 +934,17 @@ async def find_by_title(message: Message, state: FSMContext) -> None:
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=50, offset=0)
-        
-        matching = [r for r in reviews if search_term.lower() in r.get("media_title", "").lower()]
+        # The API matches titles case-insensitively, served by a trigram index
+        matching = await cached_list_reviews(
+            client, limit=10, offset=0, media_title=search_term
+        )
         
         if not matching:
             await message.answer(ru.PROMPT_NO_REVIEWS, parse_mode="HTML")
             return
         
-        # Limit to first 10 matches
-        matching = matching[:10]
-        
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in matching:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
         keyboard = pagination_keyboard(0, len(matching), len(matching), reviews=matching)
-        await message.answer("\n".join(lines), parse_mode="HTML", reply_markup=keyboard)
+        await message.answer(cached_format_reviews_feed(matching), parse_mode="HTML", reply_markup=keyboard)
     except Exception as e:
         await handle_api_error(message, e)
 
@@ -896,13 +967,21 @@ async def show_single_review(
     """
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         
-        has_image = bool(review.get("image_url"))
+        image_url = review.get("image_url")
+        has_image = bool(image_url)
         is_author = is_review_author(user_id, review)
         
-        if has_image:
-            if await send_review_with_image(message, review, client, is_author=is_author, show_back_button=show_back_button):
+        if image_url:
+            if await send_review_with_image(
+                message,
+                review,
+                client,
+                is_author=is_author,
+                show_back_button=show_back_button,
+                image_url=image_url,
+            ):
                 return
         
         await message.answer(
@@ -930,14 +1009,22 @@ async def handle_review_open(callback: CallbackQuery, callback_data: ReviewOpenC
     
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         
-        has_image = bool(review.get("image_url"))
+        image_url = review.get("image_url")
+        has_image = bool(image_url)
         is_author = is_review_author(user_id, review)
         
-        if has_image:
+        if image_url:
             # For callbacks we need to send a new message since we can't replace text with photo
-            if await send_review_with_image(callback.message, review, client, is_author=is_author, show_back_button=True):
+            if await send_review_with_image(
+                callback.message,
+                review,
+                client,
+                is_author=is_author,
+                show_back_button=True,
+                image_url=image_url,
+            ):
                 await callback.answer()
                 return
         
@@ -954,7 +1041,7 @@ async def handle_review_open(callback: CallbackQuery, callback_data: ReviewOpenC
         )
         await callback.answer()
     except Exception as e:
-        logger.exception("Error opening review")
+        log_handler_error("Error opening review", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
@@ -982,47 +1069,33 @@ async def handle_back_to_list(callback: CallbackQuery, callback_data: ReviewList
     
     try:
         client = get_api_client()
-        reviews = await client.list_reviews(limit=5, offset=offset, **filters)
+        reviews = await cached_list_reviews(client, limit=5, offset=offset, **filters)
         
         if not reviews:
             await send_or_edit_text_from_callback(callback, ru.PROMPT_NO_REVIEWS)
             await callback.answer()
             return
         
-        lines = [ru.PROMPT_REVIEWS_HEADER]
-        for review in reviews:
-            lines.append(format_review_summary(review))
-            lines.append("")
-        
         keyboard = pagination_keyboard(offset, 5, len(reviews), filter_param, reviews=reviews)
-        await send_or_edit_text_from_callback(callback, "\n".join(lines), reply_markup=keyboard)
+        await send_or_edit_text_from_callback(callback, cached_format_reviews_feed(reviews), reply_markup=keyboard)
         await callback.answer()
     except Exception as e:
-        logger.exception("Error returning to list")
+        log_handler_error("Error returning to list", e)
         await callback.answer(ru.ERR_UNEXPECTED)
 
 
-@router.message(Command("review"))
+@router.message(Command("review"), flags={"rate_limit": True})
 async def cmd_review(message: Message, command: CommandObject) -> None:
     """View a single review by ID (command)."""
     if not message.from_user:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
     if not command.args:
         await message.answer(ru.CMD_REVIEW_USAGE, parse_mode="HTML")
         return
     
-    try:
-        review_id = int(command.args.strip())
-    except ValueError:
+    review_id = _parse_pos_int(command.args)
+    if review_id is None:
         await message.answer(format_error(ru.ERR_INVALID_REVIEW_ID), parse_mode="HTML")
         return
     
@@ -1031,36 +1104,35 @@ async def cmd_review(message: Message, command: CommandObject) -> None:
 
 # ============== REVIEW ACTIONS ==============
 
-@router.callback_query(F.data.startswith("action:"))
-async def handle_review_action(callback: CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(ReviewActionCallback.filter())
+async def handle_review_action(
+    callback: CallbackQuery,
+    callback_data: ReviewActionCallback,
+    state: FSMContext,
+) -> None:
     """Handle review action button clicks."""
-    if not callback.data or not callback.message or not callback.from_user:
+    if not callback.message or not callback.from_user:
         return
     
-    parts = callback.data.split(":")
-    review_id = int(parts[1])
-    action = parts[2]
+    review_id = callback_data.id
+    action_handler = _REVIEW_ACTIONS.get(callback_data.action)
+    if action_handler is None:
+        await callback.answer()
+        return
     
     # Check ownership before allowing edit/delete/photo actions
-    if action in ("edit", "delete", "photo"):
-        try:
-            client = get_api_client()
-            review = await client.get_review(review_id)
-            if not is_review_author(callback.from_user.id, review):
-                await callback.answer(ru.ERR_NOT_YOUR_REVIEW, show_alert=True)
-                return
-        except Exception as e:
-            logger.exception("Failed to check review ownership")
-            await callback.answer(ru.ERR_UNEXPECTED)
+    try:
+        client = get_api_client()
+        review = await cached_get_review(client, review_id)
+        if not is_review_author(callback.from_user.id, review):
+            await callback.answer(ru.ERR_NOT_YOUR_REVIEW, show_alert=True)
             return
+    except Exception as e:
+        log_handler_error("Failed to check review ownership", e)
+        await callback.answer(ru.ERR_UNEXPECTED)
+        return
     
-    if action == "edit":
-        await start_review_edit(callback, state, review_id)
-    elif action == "delete":
-        await start_review_delete(callback, state, review_id)
-    elif action == "photo":
-        await show_photo_submenu(callback, state, review_id)
-    
+    await action_handler(callback, state, review_id)
     await callback.answer()
 
 
@@ -1069,9 +1141,8 @@ async def start_review_edit(callback: CallbackQuery, state: FSMContext, review_i
     if not callback.message:
         return
     
-    await state.clear()
     await state.set_state(ReviewEditStates.select_field)
-    await state.update_data(review_id=review_id)
+    await state.set_data({"review_id": review_id})
     
     await callback.message.answer(
         ru.PROMPT_EDIT_SELECT_FIELD.format(review_id),
@@ -1087,11 +1158,10 @@ async def start_review_delete(callback: CallbackQuery, state: FSMContext, review
     
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         
-        await state.clear()
         await state.set_state(ReviewDeleteStates.confirm)
-        await state.update_data(review_id=review_id)
+        await state.set_data({"review_id": review_id})
         
         await callback.message.answer(
             ru.PROMPT_DELETE_CONFIRM.format(review_id, review.get("media_title", "?")),
@@ -1099,7 +1169,7 @@ async def start_review_delete(callback: CallbackQuery, state: FSMContext, review
             parse_mode="HTML",
         )
     except Exception as e:
-        logger.exception("Failed to get review for delete")
+        log_handler_error("Failed to get review for delete", e)
 
 
 async def show_photo_submenu(callback: CallbackQuery, state: FSMContext, review_id: int) -> None:
@@ -1109,7 +1179,7 @@ async def show_photo_submenu(callback: CallbackQuery, state: FSMContext, review_
     
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         has_image = bool(review.get("image_url"))
         
         await state.update_data(review_id=review_id)
@@ -1120,39 +1190,77 @@ async def show_photo_submenu(callback: CallbackQuery, state: FSMContext, review_
             parse_mode="HTML",
         )
     except Exception as e:
-        logger.exception("Failed to get review for photo menu")
+        log_handler_error("Failed to get review for photo menu", e)
+
+
+ReviewActionHandler = Callable[[CallbackQuery, FSMContext, int], Awaitable[None]]
+
+_REVIEW_ACTIONS: dict[str, ReviewActionHandler] = {
+    "edit": start_review_edit,
+    "delete": start_review_delete,
+    "photo": show_photo_submenu,
+}
 
 
 # ============== PHOTO MANAGEMENT ==============
 
-@router.callback_query(F.data.startswith("photo:"))
-async def handle_photo_action(callback: CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(PhotoActionCallback.filter())
+async def handle_photo_action(
+    callback: CallbackQuery,
+    callback_data: PhotoActionCallback,
+    state: FSMContext,
+) -> None:
     """Handle photo submenu actions."""
-    if not callback.data or not callback.message:
+    if not callback.message:
         return
     
-    parts = callback.data.split(":")
-    review_id = int(parts[1])
-    action = parts[2]
-    
-    if action == "upload":
-        await state.set_state(ReviewPhotoStates.waiting_for_upload)
-        await state.update_data(review_id=review_id)
-        await callback.message.edit_text(ru.PROMPT_SEND_PHOTO)
-    elif action == "delete":
-        try:
-            client = get_api_client()
-            await client.update_review(review_id, _clear_fields=["image_path"])
-            await callback.message.edit_text(ru.MSG_IMAGE_DELETED, parse_mode="HTML")
-        except Exception as e:
-            logger.exception("Failed to delete image")
-            await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
-    elif action == "cancel":
-        await callback.message.delete()
+    action_handler = _PHOTO_ACTIONS.get(callback_data.action)
+    if action_handler is not None:
+        await action_handler(callback, state, callback_data.id)
     
     await callback.answer()
 
 
+async def start_photo_upload(callback: CallbackQuery, state: FSMContext, review_id: int) -> None:
+    """Ask for a new review photo."""
+    if not callback.message:
+        return
+    
+    await state.set_state(ReviewPhotoStates.waiting_for_upload)
+    await state.update_data(review_id=review_id)
+    await callback.message.edit_text(ru.PROMPT_SEND_PHOTO)
+
+
+async def delete_review_photo(callback: CallbackQuery, state: FSMContext, review_id: int) -> None:
+    """Remove the photo from a review."""
+    if not callback.message:
+        return
+    
+    try:
+        client = get_api_client()
+        await client.update_review(review_id, _clear_fields=["image_path"])
+        invalidate_review_caches(review_id)
+        await callback.message.edit_text(ru.MSG_IMAGE_DELETED, parse_mode="HTML")
+    except Exception as e:
+        log_handler_error("Failed to delete image", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
+
+
+async def cancel_photo_submenu(callback: CallbackQuery, state: FSMContext, review_id: int) -> None:
+    """Close the photo submenu."""
+    if not callback.message:
+        return
+    
+    await callback.message.delete()
+
+
+_PHOTO_ACTIONS: dict[str, ReviewActionHandler] = {
+    "upload": start_photo_upload,
+    "delete": delete_review_photo,
+    "cancel": cancel_photo_submenu,
+}
+
+
 @router.message(ReviewPhotoStates.waiting_for_upload, F.photo)
 async def upload_review_photo(message: Message, state: FSMContext) -> None:
     """Upload photo for a review."""
@@ -1176,56 +1284,42 @@ async def upload_review_photo(message: Message, state: FSMContext) -> None:
             await message.answer(format_error(ru.ERR_FAILED_TO_DOWNLOAD_IMAGE), parse_mode="HTML")
             return
         
-        file_content = await bot.download_file(file.file_path)
-        if not file_content:
-            await message.answer(format_error(ru.ERR_FAILED_TO_DOWNLOAD_IMAGE), parse_mode="HTML")
-            return
-        
-        image_data = file_content.read()
-        
+        # Upload chunks as they arrive from Telegram instead of after the download
         client = get_api_client()
         await client.upload_review_image(
             review_id=review_id,
-            image_data=image_data,
+            image_data=stream_telegram_file(bot, file.file_path),
             filename=f"review_{review_id}.jpg",
             content_type="image/jpeg",
         )
+        invalidate_review_caches(review_id)
         
         await message.answer(ru.MSG_IMAGE_UPLOADED, parse_mode="HTML")
     except Exception as e:
-        logger.exception("Failed to upload image")
-        await message.answer(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to upload image", e)
+        await message.answer(format_api_error(e), parse_mode="HTML")
 
 
 # ============== EDIT REVIEW ==============
 
-@router.message(Command("review_edit"))
+@router.message(Command("review_edit"), flags={"rate_limit": True})
 async def cmd_review_edit(message: Message, command: CommandObject, state: FSMContext) -> None:
     """Start editing a review (command)."""
     if not message.from_user:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
     if not command.args:
         await message.answer(ru.CMD_REVIEW_EDIT_USAGE, parse_mode="HTML")
         return
     
-    try:
-        review_id = int(command.args.strip())
-    except ValueError:
+    review_id = _parse_pos_int(command.args)
+    if review_id is None:
         await message.answer(format_error(ru.ERR_INVALID_REVIEW_ID), parse_mode="HTML")
         return
     
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         
         # Check ownership
         if not is_review_author(message.from_user.id, review):
@@ -1235,9 +1329,8 @@ async def cmd_review_edit(message: Message, command: CommandObject, state: FSMCo
         await handle_api_error(message, e)
         return
     
-    await state.clear()
     await state.set_state(ReviewEditStates.select_field)
-    await state.update_data(review_id=review_id)
+    await state.set_data({"review_id": review_id})
     
     await message.answer(
         ru.PROMPT_EDIT_SELECT_FIELD.format(review_id),
@@ -1259,13 +1352,21 @@ async def process_field_selection(callback: CallbackQuery, state: FSMContext) ->
     if parts[1] == "cancel":
         await state.clear()
         await callback.message.edit_text(ru.PROMPT_EDIT_CANCELLED)
-        await callback.answer()
+        _ack(callback)
         return
     
-    review_id = int(parts[1])
+    review_id = _parse_pos_int(parts[1])
+    if review_id is None or len(parts) < 3:
+        _ack(callback)
+        return
     field = parts[2]
     
-    await state.update_data(review_id=review_id, edit_field=field)
+    # Remember the current values, if at hand, to skip edits that change nothing
+    await state.update_data(
+        review_id=review_id,
+        edit_field=field,
+        review=peek_cached_review(review_id),
+    )
     
     if field == "media_type":
         await state.set_state(ReviewEditStates.edit_media_type)
@@ -1298,7 +1399,44 @@ async def process_field_selection(callback: CallbackQuery, state: FSMContext) ->
         await state.set_state(ReviewEditStates.edit_text)
         await callback.message.edit_text(ru.PROMPT_EDIT_ENTER_TEXT)
     
-    await callback.answer()
+    _ack(callback)
+
+
+def _edit_changes_nothing(review: dict[str, Any], fields: dict[str, Any]) -> bool:
+    """Check whether an edit would leave the review as it is."""
+    clear_fields = fields.get("_clear_fields", ())
+    return all(review.get(field) is None for field in clear_fields) and all(
+        review.get(field) == value
+        for field, value in fields.items()
+        if field != "_clear_fields"
+    )
+
+
+async def update_review_from_state(state: FSMContext, **fields: Any) -> dict[str, Any]:
+    """Apply an edit to the review being edited and finish the edit flow.
+    
+    The API call is skipped when the review already has the requested
+    values, e.g. when the same rating button is tapped again.
+    
+    Args:
+        state: FSM context holding the review being edited
+        **fields: Fields to update, as for ReviewsApiClient.update_review
+        
+    Returns:
+        Updated review data
+    """
+    data = await state.get_data()
+    review_id = data["review_id"]
+    current = data.get("review")
+    
+    try:
+        if current is not None and _edit_changes_nothing(current, fields):
+            return current
+        review = await get_api_client().update_review(review_id, **fields)
+        invalidate_review_caches(review_id)
+        return review
+    finally:
+        await state.clear()
 
 
 @router.callback_query(ReviewEditStates.edit_media_type, F.data.startswith("media_type:"))
@@ -1307,20 +1445,16 @@ async def edit_media_type(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    media_type = callback.data.split(":")[1]
-    data = await state.get_data()
-    review_id = data["review_id"]
+    media_type = callback.data.partition(":")[2]
     
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, media_type=media_type)
-        await state.clear()
+        review = await update_review_from_state(state, media_type=media_type)
         await callback.message.edit_text(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
-        await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to update review", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
     
-    await callback.answer()
+    _ack(callback)
 
 
 @router.callback_query(ReviewEditStates.edit_rating, F.data.startswith("rating:"))
@@ -1329,20 +1463,16 @@ async def edit_rating(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    rating = int(callback.data.split(":")[1])
-    data = await state.get_data()
-    review_id = data["review_id"]
+    rating = int(callback.data.partition(":")[2])
     
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, rating=rating)
-        await state.clear()
+        review = await update_review_from_state(state, rating=rating)
         await callback.message.edit_text(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
-        await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to update review", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
     
-    await callback.answer()
+    _ack(callback)
 
 
 @router.callback_query(ReviewEditStates.edit_contains_spoilers, F.data.startswith("spoilers:"))
@@ -1351,20 +1481,16 @@ async def edit_spoilers(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    contains_spoilers = callback.data.split(":")[1] == "yes"
-    data = await state.get_data()
-    review_id = data["review_id"]
+    contains_spoilers = callback.data.partition(":")[2] == "yes"
     
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, contains_spoilers=contains_spoilers)
-        await state.clear()
+        review = await update_review_from_state(state, contains_spoilers=contains_spoilers)
         await callback.message.edit_text(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
-        await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to update review", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
     
-    await callback.answer()
+    _ack(callback)
 
 
 @router.message(ReviewEditStates.edit_media_title)
@@ -1374,16 +1500,10 @@ async def edit_media_title(message: Message, state: FSMContext) -> None:
         await message.answer(ru.PROMPT_ENTER_TITLE_TEXT)
         return
     
-    data = await state.get_data()
-    review_id = data["review_id"]
-    
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, media_title=message.text.strip())
-        await state.clear()
+        review = await update_review_from_state(state, media_title=message.text.strip())
         await message.answer(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
         await handle_api_error(message, e)
 
 
@@ -1393,19 +1513,14 @@ async def edit_media_year_skip(callback: CallbackQuery, state: FSMContext) -> No
     if not callback.message:
         return
     
-    data = await state.get_data()
-    review_id = data["review_id"]
-    
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, _clear_fields=["media_year"])
-        await state.clear()
+        review = await update_review_from_state(state, _clear_fields=["media_year"])
         await callback.message.edit_text(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
-        await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to update review", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
     
-    await callback.answer()
+    _ack(callback)
 
 
 @router.message(ReviewEditStates.edit_media_year)
@@ -1415,25 +1530,18 @@ async def edit_media_year(message: Message, state: FSMContext) -> None:
         await message.answer(ru.PROMPT_ENTER_YEAR_TEXT)
         return
     
-    try:
-        year = int(message.text.strip())
-        if year < 1800 or year > 2100:
-            await message.answer(ru.PROMPT_ENTER_VALID_YEAR)
-            return
-    except ValueError:
+    year = _safe_int(message.text)
+    if year is None:
         await message.answer(ru.PROMPT_ENTER_VALID_YEAR_NUMBER)
         return
-    
-    data = await state.get_data()
-    review_id = data["review_id"]
+    if year not in _YEAR_RANGE:
+        await message.answer(ru.PROMPT_ENTER_VALID_YEAR)
+        return
     
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, media_year=year)
-        await state.clear()
+        review = await update_review_from_state(state, media_year=year)
         await message.answer(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
         await handle_api_error(message, e)
 
 
@@ -1444,48 +1552,33 @@ async def edit_text(message: Message, state: FSMContext) -> None:
         await message.answer(ru.PROMPT_ENTER_TEXT_CONTENT)
         return
     
-    data = await state.get_data()
-    review_id = data["review_id"]
-    
     try:
-        client = get_api_client()
-        review = await client.update_review(review_id, text=message.text.strip())
-        await state.clear()
+        review = await update_review_from_state(state, text=message.text.strip())
         await message.answer(format_review_updated(review), parse_mode="HTML")
     except Exception as e:
-        await state.clear()
         await handle_api_error(message, e)
 
 
 # ============== DELETE REVIEW ==============
 
-@router.message(Command("review_delete"))
+@router.message(Command("review_delete"), flags={"rate_limit": True})
 async def cmd_review_delete(message: Message, command: CommandObject, state: FSMContext) -> None:
     """Delete a review with confirmation (command)."""
     if not message.from_user:
         return
     
-    if not rate_limiter.is_allowed(message.from_user.id):
-        retry_after = int(rate_limiter.get_retry_after(message.from_user.id))
-        await message.answer(
-            format_error(ru.ERR_RATE_LIMIT.format(retry_after)),
-            parse_mode="HTML",
-        )
-        return
-    
     if not command.args:
         await message.answer(ru.CMD_REVIEW_DELETE_USAGE, parse_mode="HTML")
         return
     
-    try:
-        review_id = int(command.args.strip())
-    except ValueError:
+    review_id = _parse_pos_int(command.args)
+    if review_id is None:
         await message.answer(format_error(ru.ERR_INVALID_REVIEW_ID), parse_mode="HTML")
         return
     
     try:
         client = get_api_client()
-        review = await client.get_review(review_id)
+        review = await cached_get_review(client, review_id)
         
         # Check ownership
         if not is_review_author(message.from_user.id, review):
@@ -1495,9 +1588,8 @@ async def cmd_review_delete(message: Message, command: CommandObject, state: FSM
         await handle_api_error(message, e)
         return
     
-    await state.clear()
     await state.set_state(ReviewDeleteStates.confirm)
-    await state.update_data(review_id=review_id)
+    await state.set_data({"review_id": review_id})
     
     await message.answer(
         ru.PROMPT_DELETE_CONFIRM.format(review_id, review.get("media_title", "?")),
@@ -1512,7 +1604,7 @@ async def confirm_delete(callback: CallbackQuery, state: FSMContext) -> None:
     if not callback.data or not callback.message:
         return
     
-    action = callback.data.split(":")[1]
+    action = callback.data.partition(":")[2]
     data = await state.get_data()
     review_id = data["review_id"]
     
@@ -1520,14 +1612,16 @@ async def confirm_delete(callback: CallbackQuery, state: FSMContext) -> None:
     
     if action == "no":
         await callback.message.edit_text(ru.PROMPT_DELETE_CANCELLED)
-        await callback.answer()
+        _ack(callback)
         return
     
     try:
         client = get_api_client()
         await client.delete_review(review_id)
+        invalidate_review_caches(review_id)
         await callback.message.edit_text(format_review_deleted(review_id), parse_mode="HTML")
     except Exception as e:
-        await callback.message.edit_text(format_error(str(e)), parse_mode="HTML")
+        log_handler_error("Failed to delete review", e)
+        await callback.message.edit_text(format_api_error(e), parse_mode="HTML")
     
-    await callback.answer()
+    _ack(callback)
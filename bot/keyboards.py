@@ -1,6 +1,8 @@
 """Inline and reply keyboards for bot interactions."""
 
+from functools import cache, lru_cache
 from typing import Any
+from urllib.parse import unquote
 
 from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
@@ -22,6 +24,64 @@ class ReviewListCallback(CallbackData, prefix="review_list"):
     filter_param: str = ""
 
 
+class PageCallback(CallbackData, prefix="page"):
+    """Callback data for feed pagination.
+    
+    filter_param holds the filter escaped with escape_filter_param, since
+    user-typed values may contain the ':' separator.
+    """
+    offset: int
+    limit: int
+    filter_param: str = ""
+
+
+def escape_filter_param(filter_param: str) -> str:
+    """Escape a feed filter for use as a callback data value."""
+    return filter_param.replace("%", "%25").replace(":", "%3A")
+
+
+def unescape_filter_param(value: str) -> str:
+    """Reverse escape_filter_param."""
+    return unquote(value)
+
+
+def _page_callback_data(offset: int, limit: int, filter_param: str) -> str:
+    """Pack a pagination button, dropping a filter too long to fit."""
+    try:
+        return PageCallback(
+            offset=offset, limit=limit, filter_param=escape_filter_param(filter_param)
+        ).pack()
+    except ValueError:
+        # Telegram caps callback data at 64 bytes; page the unfiltered feed instead
+        return PageCallback(offset=offset, limit=limit).pack()
+
+
+class MediaTypeFilterCallback(CallbackData, prefix="filter_type"):
+    """Callback data for filtering the feed by media type."""
+    media_type: str
+
+
+class MinRatingFilterCallback(CallbackData, prefix="filter_rating"):
+    """Callback data for filtering the feed by minimum rating."""
+    min_rating: int
+
+
+class ReviewActionCallback(CallbackData, prefix="action"):
+    """Callback data for review actions (edit, delete, photo)."""
+    id: int
+    action: str
+
+
+class PhotoActionCallback(CallbackData, prefix="photo"):
+    """Callback data for photo submenu actions (upload, delete, cancel)."""
+    id: int
+    action: str
+
+
+# Keyboards without parameters (or with only a few distinct arguments) are
+# built once and shared by every message that uses them; treat the returned
+# markups as read-only.
+@cache
 def main_menu_keyboard() -> ReplyKeyboardMarkup:
     """Create main menu reply keyboard."""
     builder = ReplyKeyboardBuilder()
@@ -34,6 +94,7 @@ def main_menu_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True, is_persistent=True)
 
 
+@cache
 def media_type_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for selecting media type."""
     builder = InlineKeyboardBuilder()
@@ -48,6 +109,7 @@ def media_type_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def spoilers_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for spoilers yes/no."""
     builder = InlineKeyboardBuilder()
@@ -58,6 +120,7 @@ def spoilers_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def skip_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard with skip option."""
     builder = InlineKeyboardBuilder()
@@ -65,6 +128,7 @@ def skip_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def confirmation_keyboard(action: str = "delete") -> InlineKeyboardMarkup:
     """Create confirmation keyboard."""
     builder = InlineKeyboardBuilder()
@@ -75,6 +139,7 @@ def confirmation_keyboard(action: str = "delete") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def add_image_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for optional image upload step."""
     builder = InlineKeyboardBuilder()
@@ -122,16 +187,12 @@ def pagination_keyboard(
     nav_buttons = []
     if offset > 0:
         prev_offset = max(0, offset - limit)
-        cb_data = f"page:{prev_offset}:{limit}"
-        if filter_param:
-            cb_data += f":{filter_param}"
+        cb_data = _page_callback_data(prev_offset, limit, filter_param)
         nav_buttons.append(InlineKeyboardButton(text=ru.BTN_PREV, callback_data=cb_data))
     
     if total_shown >= limit:
         next_offset = offset + limit
-        cb_data = f"page:{next_offset}:{limit}"
-        if filter_param:
-            cb_data += f":{filter_param}"
+        cb_data = _page_callback_data(next_offset, limit, filter_param)
         nav_buttons.append(InlineKeyboardButton(text=ru.BTN_NEXT, callback_data=cb_data))
     
     if nav_buttons:
@@ -146,21 +207,43 @@ def pagination_keyboard(
     return builder.as_markup()
 
 
+@cache
 def filter_menu_keyboard() -> InlineKeyboardMarkup:
     """Create filter menu keyboard."""
     builder = InlineKeyboardBuilder()
     builder.row(
-        InlineKeyboardButton(text=ru.BTN_MOVIE, callback_data="filter:type:movie"),
-        InlineKeyboardButton(text=ru.BTN_TV, callback_data="filter:type:tv"),
+        InlineKeyboardButton(
+            text=ru.BTN_MOVIE,
+            callback_data=MediaTypeFilterCallback(media_type="movie").pack(),
+        ),
+        InlineKeyboardButton(
+            text=ru.BTN_TV,
+            callback_data=MediaTypeFilterCallback(media_type="tv").pack(),
+        ),
     )
     builder.row(
-        InlineKeyboardButton(text=ru.BTN_BOOK, callback_data="filter:type:book"),
-        InlineKeyboardButton(text=ru.BTN_PLAY, callback_data="filter:type:play"),
+        InlineKeyboardButton(
+            text=ru.BTN_BOOK,
+            callback_data=MediaTypeFilterCallback(media_type="book").pack(),
+        ),
+        InlineKeyboardButton(
+            text=ru.BTN_PLAY,
+            callback_data=MediaTypeFilterCallback(media_type="play").pack(),
+        ),
     )
     builder.row(
-        InlineKeyboardButton(text=ru.BTN_MIN_RATING.format(5), callback_data="filter:rating:5"),
-        InlineKeyboardButton(text=ru.BTN_MIN_RATING.format(7), callback_data="filter:rating:7"),
-        InlineKeyboardButton(text=ru.BTN_MIN_RATING.format(9), callback_data="filter:rating:9"),
+        InlineKeyboardButton(
+            text=ru.BTN_MIN_RATING.format(5),
+            callback_data=MinRatingFilterCallback(min_rating=5).pack(),
+        ),
+        InlineKeyboardButton(
+            text=ru.BTN_MIN_RATING.format(7),
+            callback_data=MinRatingFilterCallback(min_rating=7).pack(),
+        ),
+        InlineKeyboardButton(
+            text=ru.BTN_MIN_RATING.format(9),
+            callback_data=MinRatingFilterCallback(min_rating=9).pack(),
+        ),
     )
     builder.row(
         InlineKeyboardButton(text=ru.BTN_FILTER_MY_ONLY, callback_data="filter:my"),
@@ -171,6 +254,7 @@ def filter_menu_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def find_method_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for selecting find method."""
     builder = InlineKeyboardBuilder()
@@ -207,11 +291,20 @@ def review_actions_keyboard(
     # Only show edit/delete buttons if user is the author
     if is_author:
         builder.row(
-            InlineKeyboardButton(text=ru.BTN_EDIT, callback_data=f"action:{review_id}:edit"),
-            InlineKeyboardButton(text=ru.BTN_DELETE, callback_data=f"action:{review_id}:delete"),
+            InlineKeyboardButton(
+                text=ru.BTN_EDIT,
+                callback_data=ReviewActionCallback(id=review_id, action="edit").pack(),
+            ),
+            InlineKeyboardButton(
+                text=ru.BTN_DELETE,
+                callback_data=ReviewActionCallback(id=review_id, action="delete").pack(),
+            ),
         )
         builder.row(
-            InlineKeyboardButton(text=ru.BTN_PHOTO, callback_data=f"action:{review_id}:photo"),
+            InlineKeyboardButton(
+                text=ru.BTN_PHOTO,
+                callback_data=ReviewActionCallback(id=review_id, action="photo").pack(),
+            ),
         )
     
     # Add back to list button if requested
@@ -230,18 +323,29 @@ def photo_submenu_keyboard(review_id: int, has_image: bool = False) -> InlineKey
     """Create photo submenu keyboard."""
     builder = InlineKeyboardBuilder()
     builder.row(
-        InlineKeyboardButton(text=ru.BTN_UPLOAD_PHOTO, callback_data=f"photo:{review_id}:upload"),
+        InlineKeyboardButton(
+            text=ru.BTN_UPLOAD_PHOTO,
+            callback_data=PhotoActionCallback(id=review_id, action="upload").pack(),
+        ),
     )
     if has_image:
         builder.row(
-            InlineKeyboardButton(text=ru.BTN_DELETE_PHOTO, callback_data=f"photo:{review_id}:delete"),
+            InlineKeyboardButton(
+                text=ru.BTN_DELETE_PHOTO,
+                callback_data=PhotoActionCallback(id=review_id, action="delete").pack(),
+            ),
         )
     builder.row(
-        InlineKeyboardButton(text=ru.BTN_CANCEL, callback_data=f"photo:{review_id}:cancel"),
+        InlineKeyboardButton(
+            text=ru.BTN_CANCEL,
+            callback_data=PhotoActionCallback(id=review_id, action="cancel").pack(),
+        ),
     )
     return builder.as_markup()
 
 
+# One markup per recently edited review
+@lru_cache(maxsize=2048)
 def edit_field_keyboard(review_id: int) -> InlineKeyboardMarkup:
     """Create keyboard for selecting which field to edit."""
     builder = InlineKeyboardBuilder()
@@ -263,6 +367,7 @@ def edit_field_keyboard(review_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def rating_keyboard() -> InlineKeyboardMarkup:
     """Create keyboard for rating selection (1-10)."""
     builder = InlineKeyboardBuilder()
@@ -8,9 +8,12 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 
+from bot.api_client import close_api_client
 from bot.config import get_settings
 from bot.handlers import images, reviews, start
 from bot.logging_config import get_logger, setup_logging
+from bot.middlewares import RateLimitMiddleware
+from bot.outbound import OutboundRateLimiter
 
 
 async def main() -> None:
@@ -30,12 +33,20 @@ async def main() -> None:
         token=settings.bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+    # Pace outgoing messages to stay within Telegram's flood limits
+    bot.session.middleware(OutboundRateLimiter())
     dp = Dispatcher(storage=MemoryStorage())
     
+    # Rate-limit per user the message handlers flagged with rate_limit
+    dp.message.middleware(RateLimitMiddleware())
+    
     # Register routers
     dp.include_router(start.router)
     dp.include_router(reviews.router)
     dp.include_router(images.router)
+
+    # Release pooled API connections on shutdown
+    dp.shutdown.register(close_api_client)
     
     # Start polling
     logger.info("Bot is running. Press Ctrl+C to stop.")
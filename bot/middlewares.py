@@ -0,0 +1,49 @@
+"""Dispatcher middlewares for incoming updates."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import Message
+
+from bot.i18n import ru
+from bot.rate_limiter import RateLimiter, rate_limiter
+from bot.utils.formatting import format_error
+
+# Escaped once; only the number of seconds is filled in per rejection
+_RATE_LIMIT_HTML = format_error(ru.ERR_RATE_LIMIT)
+
+
+class RateLimitMiddleware(BaseMiddleware):
+    """Reject messages from users over the rate limit.
+
+    Registered as an inner message middleware, it checks only messages whose
+    handler is marked with flags={"rate_limit": True}: the commands and menu
+    buttons that start a flow or load data. FSM input inside a flow passes
+    through without using up the budget.
+    """
+
+    def __init__(self, limiter: RateLimiter = rate_limiter) -> None:
+        """Initialize the middleware.
+
+        Args:
+            limiter: Rate limiter tracking requests per user
+        """
+        self.limiter = limiter
+
+    async def __call__(
+        self,
+        handler: Callable[[Message, dict[str, Any]], Awaitable[Any]],
+        event: Message,
+        data: dict[str, Any],
+    ) -> Any:
+        user = data.get("event_from_user")
+        if user is None or not get_flag(data, "rate_limit"):
+            return await handler(event, data)
+        allowed, retry_after = self.limiter.try_acquire(user.id)
+        if allowed:
+            return await handler(event, data)
+
+        await event.answer(_RATE_LIMIT_HTML.format(int(retry_after)), parse_mode="HTML")
+        return None
@@ -0,0 +1,69 @@
+"""Rate limiting for outgoing Telegram Bot API calls."""
+
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+
+# Telegram allows about 30 messages per second per bot; stay just below it
+GLOBAL_RATE = 28
+
+# Average of one message per second per chat, with short bursts allowed
+CHAT_BURST = 3
+CHAT_PERIOD = 3.0
+
+
+class OutboundRateLimiter(BaseRequestMiddleware):
+    """Session middleware that paces chat-bound Bot API calls.
+
+    Calls targeting a chat (sending, editing, deleting messages) wait for
+    both a bot-wide and a per-chat limiter, so bursts are smoothed out here
+    instead of Telegram answering with RetryAfter errors. Calls without a
+    chat, such as answering callback queries or fetching files, pass through.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_RATE,
+        chat_burst: float = CHAT_BURST,
+        chat_period: float = CHAT_PERIOD,
+    ) -> None:
+        """Initialize the limiters.
+
+        Args:
+            global_rate: Maximum chat-bound calls per second across all chats
+            chat_burst: Maximum calls per chat within chat_period
+            chat_period: Per-chat window in seconds
+        """
+        self._global = AsyncLimiter(global_rate, 1)
+        self._chat_burst = chat_burst
+        self._chat_period = chat_period
+        # Idle chats drop out so the table stays bounded
+        self._chats: TTLCache[int | str, AsyncLimiter] = TTLCache(maxsize=10_000, ttl=60)
+
+    def _chat_limiter(self, chat_id: int | str) -> AsyncLimiter:
+        limiter = self._chats.get(chat_id)
+        if limiter is None:
+            limiter = AsyncLimiter(self._chat_burst, self._chat_period)
+        # Re-insert on every use to keep active chats from expiring
+        self._chats[chat_id] = limiter
+        return limiter
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[Any],
+        bot: Bot,
+        method: TelegramMethod[Any],
+    ) -> Response[Any]:
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        async with self._chat_limiter(chat_id), self._global:
+            return await make_request(bot, method)
@@ -1,65 +1,93 @@
 """Simple in-memory rate limiter for anti-spam protection."""
 
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from typing import NamedTuple
 
+# Upper bound on tracked users; keeps memory use fixed under heavy traffic
+MAX_TRACKED_USERS = 16384
+
 
 class RateLimitEntry(NamedTuple):
     """Rate limit entry for a user."""
     
     count: int
-    window_start: float
+    window_start: int
 
 
 class RateLimiter:
     """Simple in-memory rate limiter.
     
-    Limits users to a maximum number of requests per time window.
+    Limits users to a maximum number of requests per time window. Entries are
+    kept in window start order, so once more than max_users are tracked the
+    user whose window is closest to expiring is dropped first.
     """
     
     def __init__(
         self,
         max_requests: int = 30,
         window_seconds: float = 60.0,
+        max_users: int = MAX_TRACKED_USERS,
     ) -> None:
         """Initialize rate limiter.
         
         Args:
             max_requests: Maximum requests allowed per window
             window_seconds: Time window in seconds
+            max_users: Maximum number of users tracked at once
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._entries: dict[int, RateLimitEntry] = defaultdict(
-            lambda: RateLimitEntry(0, time.time())
-        )
+        self.max_users = max_users
+        # Integer nanoseconds from a monotonic clock, immune to wall clock jumps
+        self._window_ns = int(window_seconds * 1_000_000_000)
+        self._entries: OrderedDict[int, RateLimitEntry] = OrderedDict()
     
-    def is_allowed(self, user_id: int) -> bool:
-        """Check if a user is allowed to make a request.
+    def try_acquire(self, user_id: int) -> tuple[bool, float]:
+        """Count a request for a user and report when they may retry.
+        
+        Does the work of is_allowed and get_retry_after with one lookup.
         
         Args:
             user_id: Telegram user ID
             
         Returns:
-            True if the request is allowed
+            Whether the request is allowed, and the seconds until the user's
+            window resets if it is not (0.0 if it is)
         """
-        now = time.time()
-        entry = self._entries[user_id]
+        now = time.monotonic_ns()
+        entries = self._entries
+        entry = entries.get(user_id)
         
-        # Check if we're in a new window
-        if now - entry.window_start >= self.window_seconds:
-            # Reset the window
-            self._entries[user_id] = RateLimitEntry(1, now)
-            return True
+        # Start a new window for unknown users and expired windows
+        if entry is None or now - entry.window_start >= self._window_ns:
+            if self.max_requests < 1:
+                return False, self.window_seconds
+            entries[user_id] = RateLimitEntry(1, now)
+            entries.move_to_end(user_id)
+            if len(entries) > self.max_users:
+                entries.popitem(last=False)
+            return True, 0.0
         
         # Check if we've exceeded the limit
         if entry.count >= self.max_requests:
-            return False
+            remaining = self._window_ns - (now - entry.window_start)
+            return False, remaining / 1_000_000_000
         
-        # Increment the counter
-        self._entries[user_id] = RateLimitEntry(entry.count + 1, entry.window_start)
-        return True
+        # Increment the counter; the entry keeps its place in window order
+        entries[user_id] = RateLimitEntry(entry.count + 1, entry.window_start)
+        return True, 0.0
+    
+    def is_allowed(self, user_id: int) -> bool:
+        """Check if a user is allowed to make a request.
+        
+        Args:
+            user_id: Telegram user ID
+            
+        Returns:
+            True if the request is allowed
+        """
+        return self.try_acquire(user_id)[0]
     
     def get_retry_after(self, user_id: int) -> float:
         """Get seconds until rate limit resets for a user.
@@ -74,20 +102,19 @@ class RateLimiter:
         if entry is None:
             return 0.0
         
-        elapsed = time.time() - entry.window_start
-        remaining = self.window_seconds - elapsed
-        return max(0.0, remaining)
+        remaining = self._window_ns - (time.monotonic_ns() - entry.window_start)
+        return max(0.0, remaining / 1_000_000_000)
     
     def cleanup(self) -> None:
         """Remove expired entries to free memory."""
-        now = time.time()
-        expired_users = [
-            user_id
-            for user_id, entry in self._entries.items()
-            if now - entry.window_start >= self.window_seconds * 2
-        ]
-        for user_id in expired_users:
-            del self._entries[user_id]
+        expired_before = time.monotonic_ns() - self._window_ns
+        entries = self._entries
+        # Oldest windows come first, so stop at the first one still running
+        while entries:
+            user_id, entry = next(iter(entries.items()))
+            if entry.window_start > expired_before:
+                break
+            del entries[user_id]
 
 
 # Global rate limiter instance
@@ -0,0 +1,59 @@
+"""Streaming downloads of files sent to the bot."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from aiogram import Bot
+
+TELEGRAM_CHUNK_SIZE = 64 * 1024
+
+# Chunks read ahead of the consumer; bounds memory to about 512 KB per file
+TELEGRAM_PREFETCH_CHUNKS = 8
+
+
+async def stream_telegram_file(bot: Bot, file_path: str) -> AsyncIterator[bytes]:
+    """Yield a Telegram file's content while it is still downloading.
+
+    A background task reads ahead into a bounded queue, so the download
+    overlaps with whatever consumes the chunks (e.g. an upload to the API)
+    instead of finishing before it starts.
+
+    Args:
+        bot: Bot the file was sent to
+        file_path: File path on the Telegram server (from Bot.get_file)
+
+    Yields:
+        File content chunks
+    """
+    if bot.session.api.is_local:
+        # Files of a local Bot API server are read from disk by aiogram
+        buffer = await bot.download_file(file_path, chunk_size=TELEGRAM_CHUNK_SIZE)
+        if buffer is not None:
+            yield buffer.read()
+        return
+
+    queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(
+        maxsize=TELEGRAM_PREFETCH_CHUNKS
+    )
+
+    async def pump() -> None:
+        try:
+            async for chunk in bot.session.stream_content(
+                url=bot.session.api.file_url(bot.token, file_path),
+                chunk_size=TELEGRAM_CHUNK_SIZE,
+                raise_for_status=True,
+            ):
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.create_task(pump())
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
@@ -58,6 +58,20 @@ def format_review_summary(review: dict[str, Any]) -> str:
     )
 
 
+def format_reviews_feed(reviews: list[dict[str, Any]]) -> str:
+    """Format a page of the reviews feed (Russian).
+    
+    Args:
+        reviews: Review data dictionaries on the page
+        
+    Returns:
+        Formatted HTML string: the feed header and one summary per review
+    """
+    return f"{ru.PROMPT_REVIEWS_HEADER}\n" + "\n\n".join(
+        format_review_summary(review) for review in reviews
+    )
+
+
 def format_review_detail(review: dict[str, Any]) -> str:
     """Format a detailed review view (Russian).
     
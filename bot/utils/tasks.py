@@ -0,0 +1,36 @@
+"""Fire-and-forget background tasks."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from bot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Strong references so running tasks are not garbage-collected
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+    """Run a coroutine in the background without awaiting it.
+    
+    Failures are logged instead of being reported as never-retrieved
+    task exceptions.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+def _on_task_done(task: asyncio.Task[Any]) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background task failed: %r", task.exception())
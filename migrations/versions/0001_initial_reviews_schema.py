@@ -0,0 +1,76 @@
+"""Initial reviews schema.
+
+Also adopts databases created by create_all() before migrations existed:
+their reviews table is upgraded in place instead of being recreated.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.migrations import upgrade_legacy_schema
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+media_type_enum = sa.Enum("movie", "tv", "book", "play", name="mediatype")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    if sa.inspect(bind).has_table("reviews"):
+        upgrade_legacy_schema(bind)
+        return
+
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("author_name", sa.String(length=255), nullable=False),
+        sa.Column("author_telegram_id", sa.BigInteger(), nullable=True),
+        sa.Column("media_type", media_type_enum, nullable=False),
+        sa.Column("media_title", sa.String(length=255), nullable=False),
+        sa.Column("media_year", sa.Integer(), nullable=True),
+        sa.Column("rating", sa.Integer(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("contains_spoilers", sa.Boolean(), nullable=False),
+        sa.Column("image_path", sa.String(length=500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_reviews_media_title_trgm",
+        "reviews",
+        ["media_title"],
+        postgresql_using="gin",
+        postgresql_ops={"media_title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_reviews_media_type_title", "reviews", ["media_type", "media_title"]
+    )
+    op.create_index("ix_reviews_media_type_id", "reviews", ["media_type", "id"])
+
+
+def downgrade() -> None:
+    op.drop_table("reviews")
+    media_type_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,19 @@
+"""Shared fixtures for bot tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from bot.cache import image_cache, image_checks, invalidate_review_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_review_caches() -> Iterator[None]:
+    """Keep cached API responses from leaking between tests."""
+    invalidate_review_caches()
+    image_cache.clear()
+    image_checks.clear()
+    yield
+    invalidate_review_caches()
+    image_cache.clear()
+    image_checks.clear()
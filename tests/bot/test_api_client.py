@@ -2,6 +2,7 @@
 
 import pytest
 import httpx
+import orjson
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from bot.api_client import ReviewsApiClient
@@ -204,7 +205,7 @@ class TestReviewsApiClient:
             
             # Verify that media_year was sent as None
             call_kwargs = mock_request.call_args.kwargs
-            assert call_kwargs["json"]["media_year"] is None
+            assert orjson.loads(call_kwargs["content"])["media_year"] is None
 
     @pytest.mark.asyncio
     async def test_delete_review_success(self, client: ReviewsApiClient) -> None:
@@ -319,3 +320,129 @@ class TestReviewsApiClient:
             result = await client.health_check()
             
             assert result is False
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self, client: ReviewsApiClient) -> None:
+        """Test that requests share one persistent HTTP client until closed."""
+        mock_response = httpx.Response(200, json={"status": "healthy"})
+
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+
+            await client.health_check()
+            http_client = client._client
+            await client.health_check()
+
+            assert http_client is not None
+            assert client._client is http_client
+
+        await client.aclose()
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_http_client_caps_connect_timeout(self, client: ReviewsApiClient) -> None:
+        """Test that connecting times out sooner than the overall request timeout."""
+        timeout = client._get_client().timeout
+
+        assert timeout.read == 5.0
+        assert timeout.connect == 3.0
+
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_download_image(self, client: ReviewsApiClient) -> None:
+        """Test that images are downloaded, and missing ones return None."""
+        image = b"\xff\xd8\xff" + b"x" * 200_000
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/uploads/reviews/1/image.jpg":
+                return httpx.Response(200, content=image)
+            return httpx.Response(404)
+
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        assert await client.download_image("/uploads/reviews/1/image.jpg") == image
+        assert await client.download_image("/uploads/missing.jpg") is None
+
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_image_exists_sends_head_request(self, client: ReviewsApiClient) -> None:
+        """Test that image checks use HEAD and report failed checks as None."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "HEAD"
+            if request.url.path == "/uploads/down.jpg":
+                raise httpx.ConnectError("down")
+            return httpx.Response(200 if request.url.path == "/uploads/a.jpg" else 404)
+
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        assert await client.image_exists("/uploads/a.jpg") is True
+        assert await client.image_exists("/uploads/missing.jpg") is False
+        assert await client.image_exists("/uploads/down.jpg") is None
+
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_image_streams_async_chunks(self, client: ReviewsApiClient) -> None:
+        """Test that async chunks are sent as a multipart file field."""
+        captured: dict[str, bytes | str] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            captured["content_type"] = request.headers["Content-Type"]
+            captured["body"] = await request.aread()
+            return httpx.Response(200, json={"id": 1, "image_url": "/uploads/reviews/1/a.jpg"})
+
+        async def chunks():
+            yield b"\xff\xd8"
+            yield b"rest"
+
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        result = await client.upload_review_image(1, chunks(), filename="review_1.jpg")
+
+        boundary = captured["content_type"].split("boundary=")[1]
+        assert captured["content_type"].startswith("multipart/form-data")
+        assert captured["body"] == (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="review_1.jpg"\r\n'
+            "Content-Type: image/jpeg\r\n\r\n"
+        ).encode() + b"\xff\xd8rest" + f"\r\n--{boundary}--\r\n".encode()
+        assert result["id"] == 1
+
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_image_escapes_filename(self, client: ReviewsApiClient) -> None:
+        """Test that a filename cannot inject headers into the multipart body."""
+        captured: dict[str, bytes] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            captured["body"] = await request.aread()
+            return httpx.Response(200, json={"id": 1})
+
+        async def chunks():
+            yield b"data"
+
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        filename = 'a"b\\c.jpg\r\nContent-Type: text/html\r\n\r\nevil'
+        await client.upload_review_image(1, chunks(), filename=filename)
+
+        header = captured["body"].split(b"\r\n\r\n", 1)[0]
+        assert header.count(b"\r\n") == 2
+        assert (
+            b'filename="a%22b\\\\c.jpg%0D%0AContent-Type: text/html%0D%0A%0D%0Aevil"'
+            in header
+        )
+
+        await client.aclose()
@@ -0,0 +1,263 @@
+"""Tests for the bot's API response caches."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bot.cache import (
+    AsyncTTLCache,
+    BytesLRUCache,
+    cached_download_image,
+    cached_format_reviews_feed,
+    cached_get_review,
+    cached_image_exists,
+    cached_list_reviews,
+    cached_list_reviews_window,
+    invalidate_review_caches,
+    prefetch_list_reviews,
+)
+
+
+class TestAsyncTTLCache:
+    """Tests for AsyncTTLCache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        """Test that concurrent lookups for one key call the loader once."""
+        cache = AsyncTTLCache(maxsize=8, ttl=60)
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert await cache.get_or_load("key", loader) == "value"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached(self) -> None:
+        """Test that errors propagate and the next lookup retries."""
+        cache = AsyncTTLCache(maxsize=8, ttl=60)
+        loader = AsyncMock(side_effect=[RuntimeError("boom"), "value"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("key", loader)
+
+        assert await cache.get_or_load("key", loader) == "value"
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_discards_inflight_result(self) -> None:
+        """Test that a load finishing after clear() is not cached."""
+        cache = AsyncTTLCache(maxsize=8, ttl=60)
+        release = asyncio.Event()
+
+        async def slow_loader() -> str:
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.create_task(cache.get_or_load("key", slow_loader))
+        await asyncio.sleep(0)
+        cache.clear()
+        release.set()
+        assert await pending == "stale"
+
+        assert await cache.get_or_load("key", AsyncMock(return_value="fresh")) == "fresh"
+
+
+class TestCachedListReviews:
+    """Tests for cached_list_reviews."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_cached_until_invalidated(self) -> None:
+        """Test that repeated page requests reuse the cached response."""
+        client = AsyncMock()
+        client.list_reviews.return_value = [{"id": 1}]
+
+        await cached_list_reviews(client, limit=5, offset=0)
+        await cached_list_reviews(client, offset=0, limit=5)
+        assert client.list_reviews.await_count == 1
+
+        await cached_list_reviews(client, limit=5, offset=5)
+        assert client.list_reviews.await_count == 2
+
+        invalidate_review_caches()
+        await cached_list_reviews(client, limit=5, offset=0)
+        assert client.list_reviews.await_count == 3
+
+
+    @pytest.mark.asyncio
+    async def test_window_fills_the_following_page(self) -> None:
+        """Test that a page miss also caches the next page from one request."""
+        client = AsyncMock()
+        client.list_reviews.return_value = [{"id": i} for i in range(10, 2, -1)]
+
+        page = await cached_list_reviews_window(client, 5, 0, media_type="movie")
+        next_page = await cached_list_reviews(client, limit=5, offset=5, media_type="movie")
+
+        assert [r["id"] for r in page] == [10, 9, 8, 7, 6]
+        assert [r["id"] for r in next_page] == [5, 4, 3]
+        client.list_reviews.assert_awaited_once_with(limit=10, offset=0, media_type="movie")
+
+
+class TestCachedFormatReviewsFeed:
+    """Tests for cached_format_reviews_feed."""
+
+    def test_same_page_is_rendered_once(self) -> None:
+        """Test that a cached page reuses its rendered text."""
+        page = [{"id": 1, "media_title": "Inception", "media_type": "movie", "rating": 9}]
+
+        with patch("bot.cache.format_reviews_feed", return_value="feed") as fmt:
+            assert cached_format_reviews_feed(page) == "feed"
+            assert cached_format_reviews_feed(page) == "feed"
+            # An equal but distinct page, e.g. after a reload, is rendered again
+            assert cached_format_reviews_feed(list(page)) == "feed"
+
+        assert fmt.call_count == 2
+
+
+class TestCachedGetReview:
+    """Tests for cached_get_review."""
+
+    @pytest.mark.asyncio
+    async def test_review_is_cached_until_invalidated(self) -> None:
+        """Test that a review is fetched once and refetched after it changes."""
+        client = AsyncMock()
+        client.get_review.side_effect = lambda review_id: {"id": review_id}
+
+        assert await cached_get_review(client, 1) == {"id": 1}
+        await cached_get_review(client, 1)
+        await cached_get_review(client, 2)
+        assert client.get_review.await_count == 2
+
+        invalidate_review_caches(1)
+        await cached_get_review(client, 1)
+        await cached_get_review(client, 2)
+        assert client.get_review.await_count == 3
+
+
+class TestPrefetchListReviews:
+    """Tests for prefetch_list_reviews."""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_page_is_served_from_cache(self) -> None:
+        """Test that a prefetched page does not hit the API again."""
+        client = AsyncMock()
+        client.list_reviews.return_value = [{"id": 6}]
+
+        prefetch_list_reviews(client, 1001, limit=5, offset=5)
+        await asyncio.sleep(0)
+
+        assert await cached_list_reviews(client, limit=5, offset=5) == [{"id": 6}]
+        assert client.list_reviews.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_throttled_per_user(self) -> None:
+        """Test that one user cannot trigger back-to-back prefetches."""
+        client = AsyncMock()
+        client.list_reviews.return_value = []
+
+        prefetch_list_reviews(client, 1002, limit=5, offset=5)
+        prefetch_list_reviews(client, 1002, limit=5, offset=10)
+        await asyncio.sleep(0.01)
+
+        assert client.list_reviews.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_list_pages_seed_the_review_cache(self) -> None:
+        """Test that reviews from a list page are served without get_review."""
+        client = AsyncMock()
+        client.list_reviews.return_value = [{"id": 3, "media_title": "From list"}]
+
+        await cached_list_reviews(client, limit=5, offset=0)
+
+        assert await cached_get_review(client, 3) == {"id": 3, "media_title": "From list"}
+        client.get_review.assert_not_awaited()
+
+
+class TestBytesLRUCache:
+    """Tests for BytesLRUCache."""
+
+    def test_evicts_least_recently_used_over_budget(self) -> None:
+        """Test that entries are evicted oldest-first once the size cap is hit."""
+        cache = BytesLRUCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        assert cache.get("a") == b"1234"  # "a" is now most recently used
+
+        cache.set("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.get("c") == b"1234"
+
+    def test_skips_values_larger_than_budget(self) -> None:
+        """Test that an oversized value does not flush the cache."""
+        cache = BytesLRUCache(max_bytes=4)
+        cache.set("a", b"1234")
+        cache.set("big", b"12345")
+
+        assert cache.get("big") is None
+        assert cache.get("a") == b"1234"
+
+
+class TestCachedDownloadImage:
+    """Tests for cached_download_image."""
+
+    @pytest.mark.asyncio
+    async def test_image_is_downloaded_once(self) -> None:
+        """Test that repeated views of an image reuse the downloaded bytes."""
+        client = AsyncMock()
+        client.download_image.return_value = b"image"
+
+        assert await cached_download_image(client, "/uploads/reviews/1/a.jpg") == b"image"
+        assert await cached_download_image(client, "/uploads/reviews/1/a.jpg") == b"image"
+
+        client.download_image.assert_awaited_once_with("/uploads/reviews/1/a.jpg")
+
+    @pytest.mark.asyncio
+    async def test_failed_download_is_not_cached(self) -> None:
+        """Test that a failed download is retried on the next view."""
+        client = AsyncMock()
+        client.download_image.side_effect = [None, b"image"]
+
+        assert await cached_download_image(client, "/uploads/reviews/1/b.jpg") is None
+        assert await cached_download_image(client, "/uploads/reviews/1/b.jpg") == b"image"
+
+
+class TestCachedImageExists:
+    """Tests for cached_image_exists."""
+
+    @pytest.mark.asyncio
+    async def test_only_positive_answers_are_cached(self) -> None:
+        """Test that a missing or unchecked image is checked again next time."""
+        client = AsyncMock()
+        client.image_exists.side_effect = [False, None, True]
+
+        assert await cached_image_exists(client, "/uploads/a.jpg") is False
+        assert await cached_image_exists(client, "/uploads/a.jpg") is None
+        assert await cached_image_exists(client, "/uploads/a.jpg") is True
+        assert await cached_image_exists(client, "/uploads/a.jpg") is True
+
+        assert client.image_exists.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidating_a_review_drops_its_image_check(self) -> None:
+        """Test that a changed review's image is checked again."""
+        client = AsyncMock()
+        client.get_review.return_value = {"id": 1, "image_url": "/uploads/a.jpg"}
+        client.image_exists.return_value = True
+
+        await cached_get_review(client, 1)
+        await cached_image_exists(client, "/uploads/a.jpg")
+        invalidate_review_caches(1)
+        await cached_image_exists(client, "/uploads/a.jpg")
+
+        assert client.image_exists.await_count == 2
@@ -0,0 +1,48 @@
+"""Tests for streaming Telegram file downloads."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from bot.utils.files import stream_telegram_file
+
+
+def _make_bot(stream_content) -> MagicMock:
+    bot = MagicMock()
+    bot.token = "42:TOKEN"
+    bot.session.api.is_local = False
+    bot.session.api.file_url.return_value = "https://files.test/photo.jpg"
+    bot.session.stream_content = stream_content
+    return bot
+
+
+class TestStreamTelegramFile:
+    """Tests for stream_telegram_file."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks_in_order(self) -> None:
+        """Test that all chunks of the file are yielded in order."""
+
+        async def stream_content(**kwargs):
+            for chunk in (b"a", b"b", b"c"):
+                await asyncio.sleep(0)
+                yield chunk
+
+        stream = stream_telegram_file(_make_bot(stream_content), "photos/1.jpg")
+
+        assert [chunk async for chunk in stream] == [b"a", b"b", b"c"]
+
+    @pytest.mark.asyncio
+    async def test_download_error_is_raised_to_consumer(self) -> None:
+        """Test that a failed download surfaces where the chunks are consumed."""
+
+        async def stream_content(**kwargs):
+            yield b"a"
+            raise ConnectionError("reset")
+
+        stream = stream_telegram_file(_make_bot(stream_content), "photos/1.jpg")
+
+        assert await anext(stream) == b"a"
+        with pytest.raises(ConnectionError):
+            await anext(stream)
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 
+from bot.i18n import ru
 from bot.utils.formatting import (
     escape_html,
     format_media_type,
@@ -10,6 +11,7 @@ from bot.utils.formatting import (
     format_rating,
     format_spoilers,
     format_review_summary,
+    format_reviews_feed,
     format_review_detail,
     format_review_created,
     format_review_updated,
@@ -138,6 +140,23 @@ class TestFormatReviewSummary:
         assert "&lt;script&gt;" in result
 
 
+class TestFormatReviewsFeed:
+    """Tests for feed page formatting."""
+
+    def test_header_and_separated_summaries(self) -> None:
+        """Test that summaries follow the header, separated by blank lines."""
+        reviews = [
+            {"id": 1, "media_title": "First", "media_type": "movie", "rating": 8, "author_name": "A"},
+            {"id": 2, "media_title": "Second", "media_type": "book", "rating": 6, "author_name": "B"},
+        ]
+        result = format_reviews_feed(reviews)
+        
+        assert result == (
+            f"{ru.PROMPT_REVIEWS_HEADER}\n"
+            f"{format_review_summary(reviews[0])}\n\n{format_review_summary(reviews[1])}"
+        )
+
+
 class TestFormatReviewDetail:
     """Tests for detailed review formatting."""
 
@@ -0,0 +1,61 @@
+"""Tests for image handler helpers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.types import Message
+
+from bot.handlers.images import extract_review_id_from_message
+
+
+class TestExtractReviewIdFromMessage:
+    """Tests for extract_review_id_from_message."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Review #12", 12),
+            ("✅ Отзыв #34 успешно обновлён!", 34),
+            ("🎬 Title\nID: 56", 56),
+            ("ID:78", 78),
+            ("Header\n#90 some review", 90),
+        ],
+    )
+    def test_extracts_id(self, text: str, expected: int) -> None:
+        """Test that every supported pattern yields the review ID."""
+        assert extract_review_id_from_message(text) == expected
+
+    @pytest.mark.parametrize("text", [None, "", "no id here", "Title #12 in the middle"])
+    def test_returns_none_without_id(self, text: str | None) -> None:
+        """Test that messages without a review ID return None."""
+        assert extract_review_id_from_message(text) is None
+
+    def test_earliest_match_wins(self) -> None:
+        """Test that the pattern appearing first in the text is used."""
+        assert extract_review_id_from_message("ID: 5\nReview #7") == 5
+
+
+class TestHandlePhotoReply:
+    """Tests for handle_photo_reply."""
+
+    @pytest.mark.asyncio
+    async def test_missing_review_is_reported_from_upload(self) -> None:
+        """Test that the upload's 404 drives the reply, with no extra lookup."""
+        from bot.exceptions import ApiNotFound
+        from bot.handlers.images import handle_photo_reply
+
+        message = MagicMock(spec=Message)
+        message.from_user = MagicMock(id=1)
+        message.reply_to_message = MagicMock(text="Review #12", caption=None)
+        message.photo = [MagicMock(file_id="file-id-12345678")]
+        message.bot = MagicMock()
+        message.bot.get_file = AsyncMock(return_value=MagicMock(file_path="photos/1.jpg"))
+        message.answer = AsyncMock()
+
+        client = AsyncMock()
+        client.upload_review_image.side_effect = ApiNotFound()
+        with patch("bot.handlers.images.get_api_client", return_value=client):
+            await handle_photo_reply(message)
+
+        client.get_review.assert_not_called()
+        assert "12" in message.answer.await_args.args[0]
@@ -1,5 +1,8 @@
 """Tests for review handlers, specifically back-to-list functionality."""
 
+import asyncio
+import gc
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,7 +10,12 @@ from aiogram.enums import ContentType
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import CallbackQuery, Message
 
-from bot.keyboards import ReviewListCallback
+from bot.keyboards import (
+    MediaTypeFilterCallback,
+    MinRatingFilterCallback,
+    PageCallback,
+    ReviewListCallback,
+)
 
 
 class TestHandleBackToList:
@@ -199,3 +207,407 @@ class TestHandleBackToList:
             await handle_back_to_list(callback, mock_callback_data)
 
             mock_get_client.assert_not_called()
+
+
+class TestCreateReviewFromState:
+    """Tests for create_review_from_state photo handling."""
+
+    @staticmethod
+    def _make_message() -> MagicMock:
+        message = MagicMock(spec=Message)
+        message.answer = AsyncMock()
+        message.bot = MagicMock()
+        message.bot.get_file = AsyncMock(return_value=MagicMock(file_path="photos/1.jpg"))
+        return message
+
+    @staticmethod
+    def _make_state() -> MagicMock:
+        state = MagicMock()
+        state.get_data = AsyncMock(return_value={
+            "media_type": "movie",
+            "media_title": "Test Movie",
+            "rating": 8,
+            "text": "Great",
+            "photo_file_id": "file-1",
+        })
+        state.clear = AsyncMock()
+        return state
+
+    @pytest.mark.asyncio
+    async def test_photo_is_uploaded_to_created_review(self) -> None:
+        """Test that the photo resolved alongside creation is uploaded."""
+        from bot.handlers.reviews import create_review_from_state
+
+        message = self._make_message()
+        user = MagicMock(id=1, username="user", first_name="User", last_name=None)
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.create_review = AsyncMock(
+                return_value={"id": 7, "media_title": "Test Movie", "media_type": "movie", "rating": 8}
+            )
+            mock_client.upload_review_image = AsyncMock()
+            mock_get_client.return_value = mock_client
+
+            await create_review_from_state(message, self._make_state(), user, upload_image=True)
+
+        message.bot.get_file.assert_awaited_once_with("file-1")
+        mock_client.upload_review_image.assert_awaited_once()
+        assert mock_client.upload_review_image.await_args.kwargs["review_id"] == 7
+
+    @pytest.mark.asyncio
+    async def test_photo_lookup_cancelled_when_creation_fails(self) -> None:
+        """Test that a pending file lookup is dropped if the review is not created."""
+        from bot.exceptions import ApiUnavailable
+        from bot.handlers.reviews import create_review_from_state
+
+        message = self._make_message()
+        cancelled = asyncio.Event()
+
+        async def slow_get_file(file_id: str) -> MagicMock:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return MagicMock(file_path="photos/1.jpg")
+
+        async def failing_create_review(**kwargs: object) -> None:
+            await asyncio.sleep(0)  # let the file lookup start first
+            raise ApiUnavailable("down")
+
+        message.bot.get_file = slow_get_file
+        user = MagicMock(id=1, username="user", first_name="User", last_name=None)
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.create_review = failing_create_review
+            mock_client.upload_review_image = AsyncMock()
+            mock_get_client.return_value = mock_client
+
+            await create_review_from_state(message, self._make_state(), user, upload_image=True)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        mock_client.upload_review_image.assert_not_awaited()
+        message.answer.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_photo_lookup_is_retrieved_when_creation_fails(self) -> None:
+        """Test that a failed file lookup does not leave an unretrieved task exception."""
+        from bot.exceptions import ApiUnavailable
+        from bot.handlers.reviews import create_review_from_state
+
+        message = self._make_message()
+        message.bot.get_file = AsyncMock(side_effect=RuntimeError("telegram down"))
+
+        async def failing_create_review(**kwargs: object) -> None:
+            await asyncio.sleep(0)  # let the file lookup fail first
+            raise ApiUnavailable("down")
+
+        user = MagicMock(id=1, username="user", first_name="User", last_name=None)
+        loop = asyncio.get_running_loop()
+        unhandled: list[dict] = []
+        loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+        try:
+            with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+                mock_client = MagicMock()
+                mock_client.create_review = failing_create_review
+                mock_get_client.return_value = mock_client
+
+                await create_review_from_state(message, self._make_state(), user, upload_image=True)
+
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        message.bot.get_file.assert_awaited_once_with("file-1")
+        message.answer.assert_awaited_once()
+        assert unhandled == []
+
+
+class TestHandlePhotoAction:
+    """Tests for photo submenu dispatch."""
+
+    @staticmethod
+    def _make_callback() -> MagicMock:
+        callback = MagicMock(spec=CallbackQuery)
+        callback.message = MagicMock(spec=Message)
+        callback.message.delete = AsyncMock()
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        return callback
+
+    @pytest.mark.asyncio
+    async def test_cancel_deletes_submenu(self) -> None:
+        """Test that the cancel action closes the submenu."""
+        from bot.handlers.reviews import handle_photo_action
+        from bot.keyboards import PhotoActionCallback
+
+        callback = self._make_callback()
+
+        await handle_photo_action(callback, PhotoActionCallback(id=1, action="cancel"), MagicMock())
+
+        callback.message.delete.assert_awaited_once()
+        callback.answer.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_action_is_only_acknowledged(self) -> None:
+        """Test that an unknown action does nothing but answer the callback."""
+        from bot.handlers.reviews import handle_photo_action
+        from bot.keyboards import PhotoActionCallback
+
+        callback = self._make_callback()
+
+        await handle_photo_action(callback, PhotoActionCallback(id=1, action="rotate"), MagicMock())
+
+        callback.message.delete.assert_not_called()
+        callback.message.edit_text.assert_not_called()
+        callback.answer.assert_awaited_once()
+
+
+class TestSafeInt:
+    """Tests for _safe_int."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("42", 42), (" 2020\n", 2020), ("-5", -5), ("", None), ("~2020", None), ("12a", None), ("²", None)],
+    )
+    def test_parses_plain_integers_only(self, text: str, expected: int | None) -> None:
+        """Test that only plain ASCII integers are parsed."""
+        from bot.handlers.reviews import _safe_int
+
+        assert _safe_int(text) == expected
+
+
+class TestUpdateReviewFromState:
+    """Tests for update_review_from_state."""
+
+    @staticmethod
+    def _make_state(data: dict) -> MagicMock:
+        state = MagicMock()
+        state.get_data = AsyncMock(return_value=data)
+        state.clear = AsyncMock()
+        return state
+
+    @pytest.mark.asyncio
+    async def test_unchanged_value_skips_api_call(self) -> None:
+        """Test that re-selecting the current value does not call the API."""
+        from bot.handlers.reviews import update_review_from_state
+
+        current = {"id": 3, "rating": 8, "media_year": None}
+        state = self._make_state({"review_id": 3, "review": current})
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            assert await update_review_from_state(state, rating=8) is current
+            assert await update_review_from_state(state, _clear_fields=["media_year"]) is current
+
+            mock_get_client.assert_not_called()
+        state.clear.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_value_is_sent(self) -> None:
+        """Test that a real change is sent to the API."""
+        from bot.handlers.reviews import update_review_from_state
+
+        state = self._make_state({"review_id": 3, "review": {"id": 3, "rating": 8}})
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.update_review = AsyncMock(return_value={"id": 3, "rating": 9})
+            mock_get_client.return_value = mock_client
+
+            review = await update_review_from_state(state, rating=9)
+
+        mock_client.update_review.assert_awaited_once_with(3, rating=9)
+        assert review["rating"] == 9
+        state.clear.assert_awaited_once()
+
+
+class TestLogHandlerError:
+    """Tests for log_handler_error."""
+
+    def test_api_errors_are_logged_without_traceback(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that expected API errors skip traceback formatting."""
+        from bot.exceptions import ApiNotFound
+        from bot.handlers.reviews import log_handler_error
+
+        try:
+            raise ApiNotFound()
+        except ApiNotFound as e:
+            log_handler_error("Failed to delete image", e)
+
+        assert caplog.records[-1].levelname == "WARNING"
+        assert caplog.records[-1].exc_info is None
+
+    def test_unexpected_errors_keep_traceback(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that unexpected errors are logged with their traceback."""
+        from bot.handlers.reviews import log_handler_error
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            log_handler_error("Failed to delete image", e)
+
+        assert caplog.records[-1].levelname == "ERROR"
+        assert caplog.records[-1].exc_info is not None
+
+
+class TestEditCallbackErrors:
+    """Tests for error handling in the edit and delete callbacks."""
+
+    @staticmethod
+    def _make_callback(data: str) -> MagicMock:
+        callback = MagicMock(spec=CallbackQuery)
+        callback.data = data
+        callback.message = MagicMock(spec=Message)
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        return callback
+
+    @staticmethod
+    def _make_state(data: dict) -> MagicMock:
+        state = MagicMock()
+        state.get_data = AsyncMock(return_value=data)
+        state.clear = AsyncMock()
+        return state
+
+    @pytest.mark.asyncio
+    async def test_api_error_shows_friendly_message(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that API errors are logged and mapped to a user-facing message."""
+        from bot.exceptions import ApiNotFound
+        from bot.handlers.reviews import edit_rating
+        from bot.i18n import ru
+        from bot.utils.formatting import format_error
+
+        callback = self._make_callback("rating:9")
+        state = self._make_state({"review_id": 3})
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.update_review = AsyncMock(side_effect=ApiNotFound())
+            mock_get_client.return_value = mock_client
+
+            await edit_rating(callback, state)
+
+        callback.message.edit_text.assert_awaited_once_with(
+            format_error(ru.ERR_REVIEW_NOT_FOUND), parse_mode="HTML"
+        )
+        assert caplog.records[-1].levelname == "WARNING"
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_text_is_not_shown(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that internal exception text never reaches the user."""
+        from bot.handlers.reviews import confirm_delete
+        from bot.i18n import ru
+        from bot.utils.formatting import format_error
+
+        callback = self._make_callback("delete:yes")
+        state = self._make_state({"review_id": 3})
+
+        with patch("bot.handlers.reviews.get_api_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.delete_review = AsyncMock(side_effect=RuntimeError("db password leaked"))
+            mock_get_client.return_value = mock_client
+
+            await confirm_delete(callback, state)
+
+        callback.message.edit_text.assert_awaited_once_with(
+            format_error(ru.ERR_UNEXPECTED), parse_mode="HTML"
+        )
+        assert caplog.records[-1].levelname == "ERROR"
+        assert caplog.records[-1].exc_info is not None
+
+
+class TestAck:
+    """Tests for background callback acknowledgement."""
+
+    @pytest.mark.asyncio
+    async def test_confirm_delete_cancel_acknowledges_in_background(self) -> None:
+        """Test that the callback is answered without blocking the handler."""
+        from bot.handlers.reviews import confirm_delete
+
+        callback = MagicMock(spec=CallbackQuery)
+        callback.data = "delete:no"
+        callback.message = MagicMock(spec=Message)
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        state = MagicMock()
+        state.get_data = AsyncMock(return_value={"review_id": 1})
+        state.clear = AsyncMock()
+
+        await confirm_delete(callback, state)
+        callback.message.edit_text.assert_awaited_once()
+
+        await asyncio.sleep(0)
+        callback.answer.assert_awaited_once()
+
+
+class TestParsePosInt:
+    """Tests for _parse_pos_int."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("42", 42), (" 7 ", 7), ("-5", None), ("", None), ("1_000", None), ("12345678901", None)],
+    )
+    def test_parses_short_ascii_digit_strings_only(self, text: str, expected: int | None) -> None:
+        """Test that only IDs made of up to ten ASCII digits are parsed."""
+        from bot.handlers.reviews import _parse_pos_int
+
+        assert _parse_pos_int(text) == expected
+
+
+class TestCmdReviews:
+    """Tests for /reviews argument parsing."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("args", "filters", "filter_param"),
+        [
+            ("Movie", {"media_type": "movie"}, "media_type=movie"),
+            ("min_rating=7", {"min_rating": 7}, "min_rating=7"),
+            ("min_rating=x author=bob", {"author_name": "bob"}, "author_name=bob"),
+            ("author bob=1", {}, ""),
+        ],
+    )
+    async def test_parses_filters(self, args: str, filters: dict, filter_param: str) -> None:
+        """Test that known key=value filters are parsed and the rest ignored."""
+        from aiogram.filters import CommandObject
+
+        from bot.handlers.reviews import cmd_reviews
+
+        message = MagicMock(spec=Message)
+        with patch("bot.handlers.reviews.show_reviews_feed", new=AsyncMock()) as show_feed:
+            await cmd_reviews(message, CommandObject(command="reviews", args=args))
+
+        show_feed.assert_awaited_once_with(message, filters=filters, filter_param=filter_param)
+
+
+class TestLegacyFeedButtons:
+    """Tests for buttons sent before the typed pagination and filter callback data."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("data", "handler", "expected"),
+        [
+            ("filter:type:book", "apply_type_filter", MediaTypeFilterCallback(media_type="book")),
+            ("filter:rating:7", "apply_rating_filter", MinRatingFilterCallback(min_rating=7)),
+            ("page:10:5", "handle_pagination", PageCallback(offset=10, limit=5)),
+        ],
+    )
+    async def test_legacy_buttons_are_routed(self, data: str, handler: str, expected: object) -> None:
+        """Test that legacy payloads reach the typed handlers with parsed data."""
+        from bot.handlers import reviews
+
+        legacy = {
+            "apply_type_filter": reviews.apply_legacy_type_filter,
+            "apply_rating_filter": reviews.apply_legacy_rating_filter,
+            "handle_pagination": reviews.handle_legacy_pagination,
+        }[handler]
+        callback = MagicMock(spec=CallbackQuery)
+        callback.data = data
+
+        with patch(f"bot.handlers.reviews.{handler}", new=AsyncMock()) as typed_handler:
+            await legacy(callback)
+
+        typed_handler.assert_awaited_once()
+        assert typed_handler.await_args.args[1] == expected
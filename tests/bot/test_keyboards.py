@@ -0,0 +1,110 @@
+"""Tests for inline keyboards and their callback data."""
+
+from bot.keyboards import (
+    PageCallback,
+    PhotoActionCallback,
+    ReviewActionCallback,
+    confirmation_keyboard,
+    edit_field_keyboard,
+    filter_menu_keyboard,
+    main_menu_keyboard,
+    pagination_keyboard,
+    photo_submenu_keyboard,
+    review_actions_keyboard,
+    unescape_filter_param,
+)
+
+
+def _callback_data(markup) -> list[str]:
+    return [button.callback_data for row in markup.inline_keyboard for button in row]
+
+
+class TestPaginationKeyboard:
+    """Tests for pagination_keyboard."""
+
+    def test_navigation_buttons_round_trip(self) -> None:
+        """Test that prev/next buttons decode back to typed page data."""
+        markup = pagination_keyboard(5, 5, 5, "media_type=movie")
+        pages = [
+            PageCallback.unpack(data)
+            for data in _callback_data(markup)
+            if data.startswith("page:")
+        ]
+
+        assert pages == [
+            PageCallback(offset=0, limit=5, filter_param="media_type=movie"),
+            PageCallback(offset=10, limit=5, filter_param="media_type=movie"),
+        ]
+
+    def test_no_filter_param(self) -> None:
+        """Test that an empty filter decodes to an empty string."""
+        markup = pagination_keyboard(0, 5, 5)
+        (page,) = [data for data in _callback_data(markup) if data.startswith("page:")]
+
+        assert PageCallback.unpack(page) == PageCallback(offset=5, limit=5)
+
+    def test_filter_with_separator_round_trips(self) -> None:
+        """Test that a ':' in a user-typed filter is escaped, not rejected."""
+        markup = pagination_keyboard(5, 5, 5, "author_name=a:b%3A")
+        filters = {
+            unescape_filter_param(PageCallback.unpack(data).filter_param)
+            for data in _callback_data(markup)
+            if data.startswith("page:")
+        }
+
+        assert filters == {"author_name=a:b%3A"}
+
+    def test_filter_too_long_is_dropped(self) -> None:
+        """Test that a filter over Telegram's 64-byte limit falls back to no filter."""
+        markup = pagination_keyboard(5, 5, 5, "author_name=" + "Очень длинное имя автора" * 3)
+        data = _callback_data(markup)
+        pages = [PageCallback.unpack(item) for item in data if item.startswith("page:")]
+
+        assert pages == [PageCallback(offset=0, limit=5), PageCallback(offset=10, limit=5)]
+        assert all(len(item.encode()) <= 64 for item in data)
+
+
+class TestActionKeyboards:
+    """Tests for review and photo action keyboards."""
+
+    def test_review_actions_decode(self) -> None:
+        """Test that review action buttons carry the review ID and action."""
+        actions = [
+            ReviewActionCallback.unpack(data)
+            for data in _callback_data(review_actions_keyboard(42))
+        ]
+
+        assert {(a.id, a.action) for a in actions} == {
+            (42, "edit"),
+            (42, "delete"),
+            (42, "photo"),
+        }
+
+    def test_photo_actions_decode(self) -> None:
+        """Test that the photo submenu offers delete only when an image exists."""
+        without_image = {
+            PhotoActionCallback.unpack(data).action
+            for data in _callback_data(photo_submenu_keyboard(7))
+        }
+        with_image = {
+            PhotoActionCallback.unpack(data).action
+            for data in _callback_data(photo_submenu_keyboard(7, has_image=True))
+        }
+
+        assert without_image == {"upload", "cancel"}
+        assert with_image == {"upload", "delete", "cancel"}
+
+
+class TestStaticKeyboards:
+    """Tests for keyboards built once at first use."""
+
+    def test_static_keyboards_are_reused(self) -> None:
+        """Test that parameterless keyboards return the same markup object."""
+        assert main_menu_keyboard() is main_menu_keyboard()
+        assert filter_menu_keyboard() is filter_menu_keyboard()
+
+    def test_parameterized_keyboards_are_cached_per_argument(self) -> None:
+        """Test that keyboards are reused for equal arguments only."""
+        assert confirmation_keyboard("delete") is confirmation_keyboard("delete")
+        assert edit_field_keyboard(1) is edit_field_keyboard(1)
+        assert edit_field_keyboard(1) is not edit_field_keyboard(2)
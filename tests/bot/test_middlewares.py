@@ -0,0 +1,86 @@
+"""Tests for dispatcher middlewares."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import Message
+
+from bot.handlers import reviews
+from bot.middlewares import RateLimitMiddleware
+from bot.rate_limiter import RateLimiter
+
+
+def _handler_object(router_observer, callback) -> object:
+    """Return the registered handler object for a handler function."""
+    return next(h for h in router_observer.handlers if h.callback is callback)
+
+
+def _flagged_data(user_id: int = 1) -> dict:
+    """Middleware data for a handler marked with the rate_limit flag."""
+    return {
+        "event_from_user": MagicMock(id=user_id),
+        "handler": MagicMock(flags={"rate_limit": True}),
+    }
+
+
+class TestRateLimitMiddleware:
+    """Tests for RateLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_allows_requests_within_limit(self) -> None:
+        """Test that the handler runs while the user is under the limit."""
+        middleware = RateLimitMiddleware(RateLimiter(max_requests=1))
+        handler = AsyncMock(return_value="handled")
+        message = MagicMock(spec=Message)
+        message.answer = AsyncMock()
+
+        result = await middleware(handler, message, _flagged_data())
+
+        assert result == "handled"
+        message.answer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_message_over_limit(self) -> None:
+        """Test that a limited message gets an error instead of the handler."""
+        middleware = RateLimitMiddleware(RateLimiter(max_requests=1))
+        handler = AsyncMock()
+        message = MagicMock(spec=Message)
+        message.answer = AsyncMock()
+        data = _flagged_data()
+
+        await middleware(handler, message, data)
+        await middleware(handler, message, data)
+
+        handler.assert_awaited_once()
+        message.answer.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_flow_steps_are_not_limited(self) -> None:
+        """Test that only the command starting a flow uses up the budget."""
+        middleware = RateLimitMiddleware(RateLimiter(max_requests=1))
+        user = MagicMock(id=1)
+        # Button presses in between are callback queries, which never reach it
+        steps = [
+            reviews.cmd_review_new,
+            reviews.process_media_title,
+            reviews.process_review_text,
+            reviews.process_review_image,
+        ]
+        handler = AsyncMock()
+
+        for callback in steps:
+            event = MagicMock(spec=Message)
+            event.answer = AsyncMock()
+            handler_object = _handler_object(reviews.router.message, callback)
+            data = {"event_from_user": user, "handler": handler_object}
+            await middleware(handler, event, data)
+            event.answer.assert_not_called()
+
+        assert handler.await_count == len(steps)
+
+        # A second flow started right away is still limited
+        event = MagicMock(spec=Message)
+        event.answer = AsyncMock()
+        start = _handler_object(reviews.router.message, reviews.cmd_review_new)
+        await middleware(handler, event, {"event_from_user": user, "handler": start})
+        event.answer.assert_awaited_once()
@@ -0,0 +1,34 @@
+"""Tests for outgoing Telegram call rate limiting."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.methods import AnswerCallbackQuery, SendMessage
+
+from bot.outbound import OutboundRateLimiter
+
+
+class TestOutboundRateLimiter:
+    """Tests for OutboundRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_passes_requests_through(self) -> None:
+        """Test that chat-bound and chatless calls both reach Telegram."""
+        limiter = OutboundRateLimiter()
+        make_request = AsyncMock(return_value="ok")
+        bot = MagicMock()
+
+        send = SendMessage(chat_id=1, text="hi")
+        answer = AnswerCallbackQuery(callback_query_id="1")
+
+        assert await limiter(make_request, bot, send) == "ok"
+        assert await limiter(make_request, bot, answer) == "ok"
+        assert make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reuses_limiter_per_chat(self) -> None:
+        """Test that each chat gets one limiter, separate from other chats."""
+        limiter = OutboundRateLimiter()
+
+        assert limiter._chat_limiter(1) is limiter._chat_limiter(1)
+        assert limiter._chat_limiter(1) is not limiter._chat_limiter(2)
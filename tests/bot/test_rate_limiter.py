@@ -0,0 +1,58 @@
+"""Tests for the per-user rate limiter."""
+
+from unittest.mock import patch
+
+from bot.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_limits_requests_per_window(self) -> None:
+        """Test that requests over the limit are rejected until the window ends."""
+        limiter = RateLimiter(max_requests=2, window_seconds=60)
+
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=0):
+            assert limiter.is_allowed(1)
+            assert limiter.is_allowed(1)
+            assert not limiter.is_allowed(1)
+            assert limiter.is_allowed(2)
+
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=30_000_000_000):
+            assert limiter.get_retry_after(1) == 30.0
+
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=60_000_000_000):
+            assert limiter.is_allowed(1)
+
+    def test_tracked_users_are_capped(self) -> None:
+        """Test that the oldest window is dropped once max_users is exceeded."""
+        limiter = RateLimiter(max_requests=1, max_users=2)
+
+        for user_id in (1, 2, 3):
+            assert limiter.is_allowed(user_id)
+
+        assert list(limiter._entries) == [2, 3]
+        # User 1 was evicted, so it starts a fresh window
+        assert limiter.is_allowed(1)
+
+    def test_cleanup_drops_expired_windows(self) -> None:
+        """Test that cleanup removes only users whose window has ended."""
+        limiter = RateLimiter(window_seconds=60)
+
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=0):
+            limiter.is_allowed(1)
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=50_000_000_000):
+            limiter.is_allowed(2)
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=70_000_000_000):
+            limiter.cleanup()
+
+        assert list(limiter._entries) == [2]
+
+    def test_try_acquire_reports_retry_after(self) -> None:
+        """Test that a rejected request reports the time left in the window."""
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=0):
+            assert limiter.try_acquire(1) == (True, 0.0)
+        with patch("bot.rate_limiter.time.monotonic_ns", return_value=15_000_000_000):
+            assert limiter.try_acquire(1) == (False, 45.0)
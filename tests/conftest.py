@@ -1,40 +1,58 @@
 """Test fixtures and configuration."""
 
-import os
+import asyncio
 import shutil
 import tempfile
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi_cache import FastAPICache
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from app.db.session import Base, get_db
+from app.db.session import (
+    Base,
+    get_db,
+    run_after_commit_callbacks,
+    run_after_rollback_callbacks,
+)
 from app.main import app
 
 # Use in-memory SQLite database for testing with StaticPool to share connection
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def _create_tables() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _drop_tables() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
 
 
 @pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
+def db_session() -> Generator[None, None, None]:
     """Create a fresh database for each test."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    asyncio.run(_create_tables())
     try:
-        yield db
+        yield
     finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+        asyncio.run(_drop_tables())
 
 
 @pytest.fixture(scope="function")
@@ -47,29 +65,34 @@ def temp_uploads_dir() -> Generator[str, None, None]:
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session, temp_uploads_dir: str) -> Generator[TestClient, None, None]:
+def client(db_session: None, temp_uploads_dir: str) -> Generator[TestClient, None, None]:
     """Create a test client with a fresh database and temporary uploads directory."""
     # Import the router module to patch UPLOADS_DIR
     from app.api.routers import reviews
-    
+
     # Store original value
     original_uploads_dir = reviews.UPLOADS_DIR
-    
+
     # Override UPLOADS_DIR for the router
     reviews.UPLOADS_DIR = temp_uploads_dir
-    
-    def override_get_db() -> Generator[Session, None, None]:
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         """Override get_db for testing using the test session."""
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-    
+        async with TestingSessionLocal() as db:
+            try:
+                async with db.begin():
+                    yield db
+            except BaseException:
+                await run_after_rollback_callbacks(db)
+                raise
+            await run_after_commit_callbacks(db)
+
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
+        # Each test starts with a fresh database, so drop cached responses
+        c.portal.call(FastAPICache.clear)
         yield c
     app.dependency_overrides.clear()
-    
+
     # Restore original value
     reviews.UPLOADS_DIR = original_uploads_dir
@@ -1,35 +1,89 @@
 """Tests for database migrations."""
 
-from sqlalchemy import inspect
+import asyncio
+from pathlib import Path
 
-from app.db.migrations import run_migrations
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Connection
+
+from app.db.migrations import SCHEMA_REVISION, check_schema_revision, upgrade_legacy_schema
 from app.db.session import Base
 from tests.conftest import engine
 
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+
+def _alembic_config(database_url: str) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", database_url)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def _get_review_columns(connection: Connection) -> list[dict]:
+    return inspect(connection).get_columns("reviews")
+
+
+async def _migrate_and_inspect() -> list[dict]:
+    async with engine.begin() as conn:
+        # Create tables first
+        await conn.run_sync(Base.metadata.create_all)
+        try:
+            # SQLite doesn't need the migration, but it should run without error
+            await conn.run_sync(upgrade_legacy_schema)
+            return await conn.run_sync(_get_review_columns)
+        finally:
+            # Clean up
+            await conn.run_sync(Base.metadata.drop_all)
+
+
+def test_upgrade_legacy_schema_on_sqlite() -> None:
+    """Test that legacy schema upgrades run without error on SQLite (no-op for SQLite)."""
+    columns = asyncio.run(_migrate_and_inspect())
+
+    # Find author_telegram_id column
+    telegram_id_col = None
+    for col in columns:
+        if col["name"] == "author_telegram_id":
+            telegram_id_col = col
+            break
+
+    # Column should exist (either from create_all or already present)
+    # The test just verifies that migrations don't break anything
+    assert telegram_id_col is not None
+
+
+def test_schema_revision_matches_alembic_head() -> None:
+    """Test that the revision checked at startup is the latest Alembic revision."""
+    script = ScriptDirectory.from_config(_alembic_config("sqlite://"))
+    assert script.get_current_head() == SCHEMA_REVISION
+
+
+def test_alembic_upgrade_head_on_sqlite(tmp_path: Path) -> None:
+    """Test that upgrading an empty database creates the schema at SCHEMA_REVISION."""
+    db_path = tmp_path / "migrations.db"
+    command.upgrade(_alembic_config(f"sqlite+aiosqlite:///{db_path}"), "head")
+
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with sync_engine.connect() as conn:
+            assert inspect(conn).has_table("reviews")
+            # Should not raise once the database is at the expected revision
+            check_schema_revision(conn)
+    finally:
+        sync_engine.dispose()
+
 
-def test_run_migrations_on_sqlite() -> None:
-    """Test that migrations run without error on SQLite (no-op for SQLite)."""
-    # Create tables first
-    Base.metadata.create_all(bind=engine)
-    
+def test_check_schema_revision_rejects_unmigrated_database(tmp_path: Path) -> None:
+    """Test that startup refuses a database without Alembic history."""
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
     try:
-        # SQLite doesn't need the migration, but it should run without error
-        run_migrations(engine)
-        
-        # Verify the table structure is correct
-        inspector = inspect(engine)
-        columns = inspector.get_columns("reviews")
-        
-        # Find author_telegram_id column
-        telegram_id_col = None
-        for col in columns:
-            if col["name"] == "author_telegram_id":
-                telegram_id_col = col
-                break
-        
-        # Column should exist (either from create_all or already present)
-        # The test just verifies that migrations don't break anything
-        assert telegram_id_col is not None
+        with sync_engine.connect() as conn:
+            with pytest.raises(RuntimeError, match="alembic upgrade head"):
+                check_schema_revision(conn)
     finally:
-        # Clean up
-        Base.metadata.drop_all(bind=engine)
+        sync_engine.dispose()
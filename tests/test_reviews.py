@@ -1,9 +1,40 @@
 """Tests for reviews CRUD endpoints."""
 
+import asyncio
 import io
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from tests.conftest import engine
+
+# reviews table as created by the original models, before created_at and
+# updated_at got database defaults
+LEGACY_REVIEWS_DDL = """
+CREATE TABLE reviews (
+    id INTEGER NOT NULL PRIMARY KEY,
+    author_name VARCHAR(255) NOT NULL,
+    author_telegram_id BIGINT,
+    media_type VARCHAR(5) NOT NULL,
+    media_title VARCHAR(255) NOT NULL,
+    media_year INTEGER,
+    rating INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    contains_spoilers BOOLEAN NOT NULL,
+    image_path VARCHAR(500),
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+)
+"""
+
+
+async def _recreate_legacy_reviews_table() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE reviews"))
+        await conn.execute(text(LEGACY_REVIEWS_DDL))
 
 
 def test_create_review_and_fetch_it_back(client: TestClient) -> None:
@@ -128,6 +159,81 @@ def test_list_reviews_with_min_rating_filter(client: TestClient) -> None:
     assert all(r["rating"] >= 7 for r in reviews)
 
 
+def test_create_reviews_bulk(client: TestClient) -> None:
+    """Test creating several reviews in one request."""
+    response = client.post(
+        "/reviews/bulk",
+        json=[
+            {
+                "author_name": "Alice",
+                "media_type": "movie",
+                "media_title": "Bulk Movie",
+                "rating": 8,
+                "text": "First",
+            },
+            {
+                "author_name": "Bob",
+                "media_type": "book",
+                "media_title": "Bulk Book",
+                "media_year": 1999,
+                "rating": 6,
+                "text": "Second",
+                "contains_spoilers": True,
+            },
+        ],
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert [r["media_title"] for r in data] == ["Bulk Movie", "Bulk Book"]
+    assert all("id" in r and "created_at" in r for r in data)
+
+    list_response = client.get("/reviews/")
+    assert len(list_response.json()) == 2
+
+
+def test_create_reviews_bulk_rejects_oversized_batch(client: TestClient) -> None:
+    """Test that a bulk create above the batch limit is rejected without inserting."""
+    from app.api.routers.reviews import MAX_BULK_REVIEWS
+
+    review = {
+        "author_name": "Alice",
+        "media_type": "movie",
+        "media_title": "Bulk Movie",
+        "rating": 8,
+        "text": "Too many",
+    }
+    response = client.post("/reviews/bulk", json=[review] * (MAX_BULK_REVIEWS + 1))
+    assert response.status_code == 422
+
+    list_response = client.get("/reviews/")
+    assert list_response.json() == []
+
+
+def test_list_reviews_keyset_pagination(client: TestClient) -> None:
+    """Test paging through reviews newest first using after_id."""
+    ids = []
+    for i in range(5):
+        response = client.post(
+            "/reviews/",
+            json={
+                "author_name": "Alice",
+                "media_type": "movie",
+                "media_title": f"Movie {i}",
+                "rating": 5,
+                "text": "Text",
+            },
+        )
+        ids.append(response.json()["id"])
+
+    first_page = client.get("/reviews/", params={"limit": 2}).json()
+    assert [r["id"] for r in first_page] == [ids[4], ids[3]]
+
+    second_page = client.get(
+        "/reviews/", params={"limit": 2, "after_id": first_page[-1]["id"]}
+    ).json()
+    assert [r["id"] for r in second_page] == [ids[2], ids[1]]
+
+
 def test_upload_image_to_review(client: TestClient, temp_uploads_dir: str) -> None:
     """Test uploading an image to a review and confirming the response contains image_url."""
     # Create a review first
@@ -245,6 +351,26 @@ def test_review_rating_validation(client: TestClient) -> None:
     assert response.status_code == 422
 
 
+def test_create_review_rejects_coerced_types(client: TestClient) -> None:
+    """Test that JSON payloads must use real numbers and booleans."""
+    payload = {
+        "author_name": "Test",
+        "media_type": "movie",
+        "media_title": "Test Movie",
+        "rating": 8,
+        "text": "Test",
+    }
+
+    response = client.post("/reviews/", json={**payload, "rating": "8"})
+    assert response.status_code == 422
+
+    response = client.post("/reviews/", json={**payload, "contains_spoilers": "yes"})
+    assert response.status_code == 422
+
+    response = client.post("/reviews/", json={**payload, "contains_spoilers": True})
+    assert response.status_code == 201
+
+
 def test_update_review(client: TestClient) -> None:
     """Test partial update of a review."""
     # Create review
@@ -301,6 +427,13 @@ def test_health_check(client: TestClient) -> None:
     assert response.json() == {"status": "healthy"}
 
 
+def test_pool_status(client: TestClient) -> None:
+    """Test connection pool status endpoint."""
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+    assert isinstance(response.json()["pool"], str)
+
+
 def test_upload_image_non_image_file_rejected(client: TestClient) -> None:
     """Test that non-image files are rejected."""
     # Create a review first
@@ -353,6 +486,91 @@ def test_upload_image_invalid_signature_rejected(client: TestClient) -> None:
     assert "invalid" in upload_response.json()["detail"].lower()
 
 
+def test_upload_image_too_large_rejected(client: TestClient, temp_uploads_dir: str) -> None:
+    """Test that oversized images are rejected and no partial file is left behind."""
+    create_response = client.post(
+        "/reviews/",
+        json={
+            "author_name": "Alice",
+            "media_type": "movie",
+            "media_title": "Test Movie",
+            "rating": 8,
+            "text": "Great movie!",
+        },
+    )
+    assert create_response.status_code == 201
+    review_id = create_response.json()["id"]
+
+    jpeg_header = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01"
+    big_image = io.BytesIO(jpeg_header + b"\x00" * (5 * 1024 * 1024))
+    upload_response = client.post(
+        f"/reviews/{review_id}/image",
+        files={"file": ("big.jpg", big_image, "image/jpeg")},
+    )
+    assert upload_response.status_code == 400
+    assert "size" in upload_response.json()["detail"].lower()
+
+    review_dir = Path(temp_uploads_dir) / "reviews" / str(review_id)
+    assert not review_dir.exists() or not any(review_dir.iterdir())
+
+
+def test_upload_image_move_failure_leaves_review_unchanged(
+    client: TestClient, temp_uploads_dir: str
+) -> None:
+    """Test that a failed move keeps image_path unset and removes the staged file."""
+    create_response = client.post(
+        "/reviews/",
+        json={
+            "author_name": "Alice",
+            "media_type": "movie",
+            "media_title": "Test Movie",
+            "rating": 8,
+            "text": "Great movie!",
+        },
+    )
+    assert create_response.status_code == 201
+    review_id = create_response.json()["id"]
+
+    jpeg_header = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01"
+    test_image = io.BytesIO(jpeg_header + b"\x00" * 100)
+    with patch("app.api.routers.reviews.aiofiles.os.replace", side_effect=OSError("disk full")):
+        upload_response = client.post(
+            f"/reviews/{review_id}/image",
+            files={"file": ("test_image.jpg", test_image, "image/jpeg")},
+        )
+    assert upload_response.status_code == 500
+
+    assert client.get(f"/reviews/{review_id}").json()["image_path"] is None
+    review_dir = Path(temp_uploads_dir) / "reviews" / str(review_id)
+    assert not review_dir.exists() or not any(review_dir.iterdir())
+
+
+def test_create_review_with_image_failure_removes_file(
+    client: TestClient, temp_uploads_dir: str
+) -> None:
+    """Test that an image stored for a review that is rolled back is deleted."""
+    jpeg_header = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01"
+    test_image = io.BytesIO(jpeg_header + b"\x00" * 100)
+    with (
+        patch("app.api.routers.reviews.after_commit", side_effect=RuntimeError("boom")),
+        pytest.raises(RuntimeError),
+    ):
+        client.post(
+            "/reviews/with-image",
+            data={
+                "author_name": "Alice",
+                "media_type": "movie",
+                "media_title": "Test Movie",
+                "rating": "8",
+                "text": "Great movie!",
+            },
+            files={"file": ("test_image.jpg", test_image, "image/jpeg")},
+        )
+
+    assert client.get("/reviews/").json() == []
+    assert not [path for path in Path(temp_uploads_dir).rglob("*") if path.is_file()]
+
+
 def test_list_reviews_with_media_title_filter(client: TestClient) -> None:
     """Test listing reviews filtered by media_title substring."""
     # Create reviews
@@ -395,6 +613,27 @@ def test_list_reviews_with_media_title_filter(client: TestClient) -> None:
     assert all("Matrix" in r["media_title"] for r in reviews)
 
 
+def test_media_title_filter_matches_wildcards_literally(client: TestClient) -> None:
+    """Test that % and _ in the title filter are not treated as LIKE wildcards."""
+    for title in ("100% Wolf", "100 Wolves", "A_B", "AxB"):
+        client.post(
+            "/reviews/",
+            json={
+                "author_name": "Alice",
+                "media_type": "movie",
+                "media_title": title,
+                "rating": 7,
+                "text": "Fine",
+            },
+        )
+
+    response = client.get("/reviews/", params={"media_title": "100%"})
+    assert [r["media_title"] for r in response.json()] == ["100% Wolf"]
+
+    response = client.get("/reviews/", params={"media_title": "a_b"})
+    assert [r["media_title"] for r in response.json()] == ["A_B"]
+
+
 def test_create_review_with_large_telegram_id(client: TestClient) -> None:
     """Test creating a review with a large Telegram user ID (exceeds 32-bit integer)."""
     # Telegram IDs can exceed the 32-bit integer max (2,147,483,647)
@@ -420,3 +659,27 @@ def test_create_review_with_large_telegram_id(client: TestClient) -> None:
     assert data["author_telegram_id"] == large_telegram_id
     assert data["media_title"] == "Таксист"
     assert data["rating"] == 9
+
+
+def test_create_and_update_review_on_legacy_sqlite_table(client: TestClient) -> None:
+    """Test that timestamps are filled in on a table without column defaults."""
+    asyncio.run(_recreate_legacy_reviews_table())
+
+    create_response = client.post(
+        "/reviews/",
+        json={
+            "author_name": "Alice",
+            "media_type": "book",
+            "media_title": "Old Schema",
+            "rating": 7,
+            "text": "Still works",
+        },
+    )
+    assert create_response.status_code == 201
+    data = create_response.json()
+    assert data["created_at"] is not None
+    assert data["updated_at"] is not None
+
+    update_response = client.patch(f"/reviews/{data['id']}", json={"rating": 8})
+    assert update_response.status_code == 200
+    assert update_response.json()["rating"] == 8